@@ -11,7 +11,7 @@ _start_check()
 is_aion = _start_check.is_aion
 is_linux = _start_check.is_linux
 
-from ._utils import aion_data_path, aion_path, raise_aion_not_installed_error
+from ._utils import aion_data_path, aion_path, compile_snapshots, compile_xml_snapshot, invalidate_xml_cache, raise_aion_not_installed_error, set_xml_fsync_policy
 
 from . import config, language, logging, plugin, utils, variable
 
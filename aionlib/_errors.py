@@ -4,4 +4,11 @@
 class AionNotInstalledError(Exception):
 
     def __init__(self):
-        super().__init__("Aion isn't installed")
\ No newline at end of file
+        super().__init__("Aion isn't installed")
+
+
+class PluginError(Exception):
+
+    def __init__(self, errors: dict) -> None:
+        self.errors = errors
+        super().__init__("the plugins " + ", ".join(errors) + " failed")
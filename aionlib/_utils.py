@@ -3,7 +3,15 @@
 from ._errors import AionNotInstalledError
 from . import _variables
 
+from collections import OrderedDict as _OrderedDict
+from collections.abc import ItemsView as _ItemsView, KeysView as _KeysView, Mapping as _Mapping, Sequence as _Sequence, ValuesView as _ValuesView
+from contextlib import contextmanager as _contextmanager
+from copy import deepcopy as _deepcopy
 from glob import glob as _glob
+from io import StringIO as _StringIO
+from re import compile as _compile
+from threading import RLock as _RLock
+from types import MappingProxyType as _MappingProxyType
 from xml.dom import minidom as _minidom
 import xml.etree.ElementTree as _ET
 
@@ -84,6 +92,1225 @@ def start_check() -> None:
         start_check.is_aion = True
 
 
+def _file_signature(fname: str) -> tuple:
+    """
+    returns the signature of a file, which changes every time the file gets modified or replaced
+
+    :param fname: str
+        path of the file
+        syntax: <filename>
+        example: "/home/pi/test.xml"
+    :return: tuple
+        returns the signature of the file or None if the file doesn't exist
+        syntax: (<mtime in nanoseconds>, <size>, <inode>)
+        example: (1591360271000000000, 2048, 393219)
+
+    :since: 0.2.0
+    """
+    from os import stat
+
+    try:
+        stat_result = stat(fname)
+    except FileNotFoundError:
+        return None
+    return stat_result.st_mtime_ns, stat_result.st_size, stat_result.st_ino
+
+
+def _strip_whitespace(root: _ET.Element) -> _ET.Element:
+    """
+    removes all whitespace-only texts and tails (the indentation of pretty printed files) from the given element and its sub elements
+
+    :param root: xml.etree.ElementTree.Element
+        element to strip
+    :return: xml.etree.ElementTree.Element
+        returns the given element
+
+    :since: 0.2.0
+    """
+    for element in root.iter():
+        if element.text is not None and not element.text.strip():
+            element.text = None
+        if element.tail is not None and not element.tail.strip():
+            element.tail = None
+    return root
+
+
+class XMLIndex:
+    """
+    an index of all elements of a xml tree by tag, by tag and attributes and of the parent of every element.
+    changes to the tree must be reported with 'add', 'remove' and 'update_attrib' to keep the index up to date
+
+    :since: 0.2.0
+    """
+
+    def __init__(self, root: _ET.Element) -> None:
+        """
+        :param root: xml.etree.ElementTree.Element
+            root element of the tree to index
+        :return: None
+
+        :since: 0.2.0
+        """
+        self.root = root
+
+        self._tags = {}
+        self._parents = {root: None}
+        self._attribs = None
+
+        for element in root.iter():
+            try:
+                self._tags[element.tag][element] = None
+            except KeyError:
+                self._tags[element.tag] = {element: None}
+        for parent in root.iter():
+            for child in parent:
+                self._parents[child] = parent
+
+    def add(self, element: _ET.Element, parent: _ET.Element) -> None:
+        """
+        adds an element, which was appended to a parent in the tree, and all its sub elements to the index
+
+        :param element: xml.etree.ElementTree.Element
+            the new element
+        :param parent: xml.etree.ElementTree.Element
+            parent of the new element
+        :return: None
+
+        :since: 0.2.0
+        """
+        self._parents[element] = parent
+        for sub_element in element.iter():
+            for child in sub_element:
+                self._parents[child] = sub_element
+            try:
+                self._tags[sub_element.tag][sub_element] = None
+            except KeyError:
+                self._tags[sub_element.tag] = {sub_element: None}
+            if self._attribs is not None:
+                self._attribs.setdefault(_attrib_key(sub_element.tag, sub_element.attrib), {})[sub_element] = None
+
+    def remove(self, element: _ET.Element) -> None:
+        """
+        removes an element, which was removed from the tree, and all its sub elements from the index
+
+        :param element: xml.etree.ElementTree.Element
+            the removed element
+        :return: None
+
+        :since: 0.2.0
+        """
+        for sub_element in element.iter():
+            self._parents.pop(sub_element, None)
+            elements = self._tags.get(sub_element.tag)
+            if elements is not None:
+                elements.pop(sub_element, None)
+                if not elements:
+                    del self._tags[sub_element.tag]
+            if self._attribs is not None:
+                self._discard_attrib(sub_element, _attrib_key(sub_element.tag, sub_element.attrib))
+
+    def update_attrib(self, element: _ET.Element, old_attrib: dict) -> None:
+        """
+        updates the index after the attributes of an element were changed
+
+        :param element: xml.etree.ElementTree.Element
+            the changed element
+        :param old_attrib: dict
+            attributes of the element before they were changed
+            syntax: {<key>: <value>}
+            example: {"author": "blueShard"}
+        :return: None
+
+        :since: 0.2.0
+        """
+        if self._attribs is not None:
+            self._discard_attrib(element, _attrib_key(element.tag, old_attrib))
+            self._attribs.setdefault(_attrib_key(element.tag, element.attrib), {})[element] = None
+
+    def _discard_attrib(self, element: _ET.Element, key: tuple) -> None:
+        """
+        removes an element from the tag and attributes index
+
+        :param element: xml.etree.ElementTree.Element
+            element to remove
+        :param key: tuple
+            key of the element (see '_attrib_key')
+        :return: None
+
+        :since: 0.2.0
+        """
+        elements = self._attribs.get(key)
+        if elements is not None:
+            elements.pop(element, None)
+            if not elements:
+                del self._attribs[key]
+
+    def __contains__(self, element: _ET.Element) -> bool:
+        return element in self._parents
+
+    def count(self, tag: str) -> int:
+        """
+        returns the number of elements with the given tag
+
+        :param tag: str
+            tag of the elements
+            syntax: <tag>
+            example: "sub_child"
+        :return: int
+            returns the number of elements
+            syntax: <number>
+            example: 5
+
+        :since: 0.2.0
+        """
+        return len(self._tags.get(tag, ()))
+
+    def elements(self, tag: str) -> list:
+        """
+        returns all elements with the given tag, in document order for an unchanged tree and in order of their addition for new elements
+
+        :param tag: str
+            tag of the elements
+            syntax: <tag>
+            example: "sub_child"
+        :return: list
+            returns a list of all found elements
+
+        :since: 0.2.0
+        """
+        return list(self._tags.get(tag, ()))
+
+    def find(self, tag: str, attrib: dict) -> list:
+        """
+        returns all elements with the given tag and exactly the given attributes
+
+        :param tag: str
+            tag of the elements
+            syntax: <tag>
+            example: "root_child"
+        :param attrib: dict
+            attributes of the elements
+            syntax: {<key>: <value>}
+            example: {"author": "blueShard"}
+        :return: list
+            returns a list of all found elements
+
+        :since: 0.2.0
+        """
+        if self._attribs is None:
+            attribs = {}
+            for elements in self._tags.values():
+                for element in elements:
+                    attribs.setdefault(_attrib_key(element.tag, element.attrib), {})[element] = None
+            self._attribs = attribs
+        return list(self._attribs.get(_attrib_key(tag, attrib), ()))
+
+    def parent(self, element: _ET.Element) -> _ET.Element:
+        """
+        returns the parent of an element
+
+        :param element: xml.etree.ElementTree.Element
+            element of the indexed tree
+        :return: xml.etree.ElementTree.Element
+            returns the parent element or None if the element is the root element
+
+        :since: 0.2.0
+        """
+        return self._parents[element]
+
+    def tags(self) -> list:
+        """
+        returns all tags of the indexed tree
+
+        :return: list
+            returns a list of all tags, ordered by their first appearance
+            syntax: [<tag>]
+            example: ["root", "root_child", "sub_child"]
+
+        :since: 0.2.0
+        """
+        return list(self._tags)
+
+
+def _attrib_key(tag: str, attrib: dict) -> tuple:
+    """
+    returns a hashable key of a tag and its attributes
+
+    :param tag: str
+        tag of an element
+        syntax: <tag>
+        example: "root_child"
+    :param attrib: dict
+        attributes of an element
+        syntax: {<key>: <value>}
+        example: {"author": "blueShard"}
+    :return: tuple
+        returns the key
+        syntax: (<tag>, frozenset({(<key>, <value>)}))
+        example: ("root_child", frozenset({("author", "blueShard")}))
+
+    :since: 0.2.0
+    """
+    return tag, frozenset(attrib.items())
+
+
+# attributes of elements are handed out as read only views (see 'XMLDocument.infos'), this is the view of elements without attributes
+_empty_attrib = _MappingProxyType({})
+
+
+class XMLDocument:
+    """
+    a parsed '.xml' file, shared by all readers and writers of the file as long as it isn't modified
+
+    :since: 0.2.0
+    """
+
+    def __init__(self, fname: str, root: _ET.Element, signature: tuple) -> None:
+        """
+        :param fname: str
+            absolute path of the parsed file
+            syntax: <filename>
+            example: "/home/pi/test.xml"
+        :param root: xml.etree.ElementTree.Element
+            root element of the parsed file
+        :param signature: tuple
+            signature of the file and its journal at parse time (see '_document_signature')
+            syntax: ((<mtime in nanoseconds>, <size>, <inode>), <journal signature or None>)
+            example: ((1591360271000000000, 2048, 393219), None)
+        :return: None
+
+        :since: 0.2.0
+        """
+        self.fname = fname
+        self.root = root
+        self.signature = signature
+
+        self._index = None
+
+    @property
+    def index(self) -> XMLIndex:
+        """
+        index of the document, which is build at the first access
+
+        :return: XMLIndex
+            returns the index of the document
+
+        :since: 0.2.0
+        """
+        if self._index is None:
+            self._index = XMLIndex(self.root)
+        return self._index
+
+    @property
+    def root_tag(self) -> str:
+        """
+        tag of the root element
+
+        :return: str
+            returns the tag of the root element
+            syntax: <tag>
+            example: "root"
+
+        :since: 0.2.0
+        """
+        return self.root.tag
+
+    def elements(self, tag: str) -> list:
+        """
+        returns all elements with the given tag
+
+        :param tag: str
+            tag of the elements
+            syntax: <tag>
+            example: "sub_child"
+        :return: list
+            returns a list of all found elements, which can be passed to 'infos'
+
+        :since: 0.2.0
+        """
+        return self.index.elements(tag)
+
+    def exist_child(self, parent_tag: str, elem_tag: str) -> bool:
+        """
+        checks if an element is a child of an element with the given parent tag
+
+        :param parent_tag: str
+            name of the parent element
+            syntax: <parent name>
+            example: "<root>"
+            NOTE: '<root>' stands for the root element
+        :param elem_tag: str
+            name of the element
+            syntax: <element name>
+            example: "sub_child"
+        :return: bool
+            returns True if the element exist / False if not
+            syntax: <boolean>
+            example: True
+
+        :since: 0.2.0
+        """
+        index = self.index
+        for element in index.elements(elem_tag):
+            parent = index.parent(element)
+            if parent is not None and (parent.tag == parent_tag or (parent_tag == "<root>" and parent is self.root)):
+                return True
+        return False
+
+    def infos(self, element: _ET.Element, all_elements: bool = False) -> dict:
+        """
+        creates the info dict of an element (see 'BaseXMLReader.get_infos')
+
+        :param element: xml.etree.ElementTree.Element
+            element from which the infos are created
+        :param all_elements: bool, optional
+            sets if the infos were requested with '<all>', which only changes the parent infos of the root element
+            syntax: <boolean>
+            example: False
+        :return: dict
+            returns the infos of the element, the attributes are read only views of the shared element tree
+            syntax: {"parent": {"tag": <parent tag>, "text": <text of the parent element>, "attrib": {<attributes of the parent element>}}, "childs": [<childs of the element>], "tag": <tag of the element>, "text": <text of the element>, "attrib": {<attributes of the element>}}
+            example: {"parent": {"tag": "root_child", "text": "", "attrib": {"author": "blueShard"}}, "childs": [], "tag": "sub_child", "text": "This is a sub element", "attrib": {}}
+
+        :since: 0.2.0
+        """
+        # the element tree is shared by the whole process, so the attributes are only handed out read only
+        parent = self.index.parent(element)
+        if parent is None:
+            if all_elements:
+                return {"parent": {"tag": "", "text": "", "attrib": _empty_attrib}, "childs": [child.tag for child in element], "tag": element.tag, "text": "", "attrib": _MappingProxyType(element.attrib)}
+            else:
+                return {"parent": {}, "childs": [child.tag for child in element], "tag": element.tag, "text": "", "attrib": _MappingProxyType(element.attrib)}
+        return {"parent": {"tag": parent.tag, "text": parent.text, "attrib": _MappingProxyType(parent.attrib)}, "childs": [child.tag for child in element], "tag": element.tag, "text": element.text, "attrib": _MappingProxyType(element.attrib)}
+
+    def tags(self) -> list:
+        """
+        returns all tags of the document
+
+        :return: list
+            returns a list of all tags, ordered by their first appearance
+            syntax: [<tag>]
+            example: ["root", "root_child", "sub_child"]
+
+        :since: 0.2.0
+        """
+        return self.index.tags()
+
+
+class XMLSnapshotDocument(XMLDocument):
+    """
+    a '.xml' file loaded from its precompiled snapshot (see 'compile_xml_snapshot').
+    infos are read directly from the flat tables of the snapshot, the element tree is only build if 'root' or 'index' is accessed
+
+    :since: 0.2.0
+    """
+
+    def __init__(self, fname: str, tables: tuple, signature: tuple) -> None:
+        """
+        :param fname: str
+            absolute path of the file
+            syntax: <filename>
+            example: "/home/pi/test.xml"
+        :param tables: tuple
+            the tables of the snapshot
+            syntax: (<tags>, <texts>, <attributes>, <parents>, <childs>, <tag index>)
+            NOTE: every table except the tag index has one entry per element (in document order, the root element is 0).
+                  the tag index maps every tag to the element numbers with this tag
+        :param signature: tuple
+            signature of the file (see '_document_signature')
+            syntax: ((<mtime in nanoseconds>, <size>, <inode>), None)
+            example: ((1591360271000000000, 2048, 393219), None)
+        :return: None
+
+        :since: 0.2.0
+        """
+        self.fname = fname
+        self.signature = signature
+
+        self._tags, self._texts, self._attribs, self._parents, self._childs, self._tag_index = tables
+        self._root = None
+        self._index = None
+
+    @property
+    def root(self) -> _ET.Element:
+        """
+        root element of the document, the element tree is build at the first access
+
+        :return: xml.etree.ElementTree.Element
+            returns the root element
+
+        :since: 0.2.0
+        """
+        if self._root is None:
+            elements = []
+            for number, tag in enumerate(self._tags):
+                attrib = dict(self._attribs[number]) if self._attribs[number] else {}
+                if number == 0:
+                    element = _ET.Element(tag, attrib)
+                else:
+                    element = _ET.SubElement(elements[self._parents[number]], tag, attrib)
+                element.text = self._texts[number]
+                elements.append(element)
+            self._root = elements[0]
+        return self._root
+
+    @property
+    def root_tag(self) -> str:
+        return self._tags[0]
+
+    def elements(self, tag: str) -> tuple:
+        return self._tag_index.get(tag, ())
+
+    def exist_child(self, parent_tag: str, elem_tag: str) -> bool:
+        for number in self._tag_index.get(elem_tag, ()):
+            parent = self._parents[number]
+            if parent >= 0 and (self._tags[parent] == parent_tag or (parent_tag == "<root>" and parent == 0)):
+                return True
+        return False
+
+    def infos(self, element: int, all_elements: bool = False) -> dict:
+        tags = self._tags
+        childs = [tags[child] for child in self._childs[element]]
+        attrib = _MappingProxyType(dict(self._attribs[element])) if self._attribs[element] else _empty_attrib
+        parent = self._parents[element]
+        if parent < 0:
+            if all_elements:
+                return {"parent": {"tag": "", "text": "", "attrib": _empty_attrib}, "childs": childs, "tag": tags[element], "text": "", "attrib": attrib}
+            else:
+                return {"parent": {}, "childs": childs, "tag": tags[element], "text": "", "attrib": attrib}
+        parent_attrib = _MappingProxyType(dict(self._attribs[parent])) if self._attribs[parent] else _empty_attrib
+        return {"parent": {"tag": tags[parent], "text": self._texts[parent], "attrib": parent_attrib}, "childs": childs, "tag": tags[element], "text": self._texts[element], "attrib": attrib}
+
+    def tags(self) -> list:
+        return list(self._tag_index)
+
+
+_snapshot_magic = b"AIONXS1\n"
+
+
+def _load_snapshot(fname: str, signature: tuple) -> XMLSnapshotDocument:
+    """
+    loads the snapshot of a file if it exists and was compiled from the current version of the file
+
+    :param fname: str
+        absolute path of the file
+        syntax: <filename>
+        example: "/home/pi/test.xml"
+    :param signature: tuple
+        current signature of the file (see '_document_signature')
+        syntax: ((<mtime in nanoseconds>, <size>, <inode>), None)
+        example: ((1591360271000000000, 2048, 393219), None)
+    :return: XMLSnapshotDocument
+        returns the loaded document or None if there is no valid snapshot
+
+    :since: 0.2.0
+    """
+    from marshal import loads
+    from mmap import mmap, ACCESS_READ
+
+    try:
+        file = open(fname + ".snapshot", "rb")
+    except FileNotFoundError:
+        return None
+    with file:
+        try:
+            snapshot = mmap(file.fileno(), 0, access=ACCESS_READ)
+        except ValueError:
+            # empty file
+            return None
+        with snapshot:
+            if snapshot[:len(_snapshot_magic)] != _snapshot_magic:
+                return None
+            with memoryview(snapshot) as view:
+                try:
+                    source_signature, tables = loads(view[len(_snapshot_magic):])
+                except (EOFError, TypeError, ValueError):
+                    return None
+    if source_signature != signature[0]:
+        return None
+    return XMLSnapshotDocument(fname, tables, signature)
+
+
+def compile_xml_snapshot(fname: str) -> str:
+    """
+    compiles a '.xml' file into a binary snapshot ('<filename>.snapshot'), which is loaded instead of the file as long as the file isn't changed.
+    loading a snapshot doesn't need any xml parsing, so readers of big files (e.g. 'skills.xml' or '.lng' files) start faster
+
+    :param fname: str
+        filename of the file you want to compile
+        syntax: <filename>
+        example: "/etc/aion_data/skills/skills.xml"
+    :return: str
+        returns the filename of the snapshot
+        syntax: <filename>
+        example: "/etc/aion_data/skills/skills.xml.snapshot"
+
+    :since: 0.2.0
+    """
+    from marshal import dumps
+    from os.path import abspath
+
+    fname = abspath(fname)
+    if _file_signature(fname + ".journal") is not None:
+        # the snapshot must match the file itself, so the journal is folded into the file first
+        writer = BaseXMLWriter(fname)
+        writer.write()
+
+    document = document_cache.get(fname)
+    root = document.root
+
+    tags = []
+    texts = []
+    attribs = []
+    parents = []
+    childs = []
+    tag_index = {}
+    numbers = {root: 0}
+    for element in root.iter():
+        number = len(tags)
+        numbers[element] = number
+        tags.append(element.tag)
+        texts.append(element.text)
+        attribs.append(tuple(element.attrib.items()) if element.attrib else None)
+        childs.append([])
+        tag_index.setdefault(element.tag, []).append(number)
+    parents = [-1] * len(tags)
+    for parent in root.iter():
+        parent_number = numbers[parent]
+        for child in parent:
+            parents[numbers[child]] = parent_number
+            childs[parent_number].append(numbers[child])
+
+    tables = (tuple(tags), tuple(texts), tuple(attribs), tuple(parents), tuple(tuple(child_numbers) for child_numbers in childs),
+              {tag: tuple(element_numbers) for tag, element_numbers in tag_index.items()})
+
+    with _open_write(fname + ".snapshot", "wb") as file:
+        file.write(_snapshot_magic)
+        file.write(dumps((document.signature[0], tables)))
+    return fname + ".snapshot"
+
+
+def compile_snapshots() -> list:
+    """
+    compiles snapshots (see 'compile_xml_snapshot') of all skill, plugin, language ('.lng') and activate phrase ('.acph') files of aion
+
+    :return: list
+        returns the filenames of all compiled snapshots
+        syntax: [<filename>]
+        example: ["/etc/aion_data/skills/skills.xml.snapshot"]
+
+    :since: 0.2.0
+    """
+    from os.path import isfile
+    from .plugin import run_after_file, run_before_file
+    from .skill import skills_file
+
+    fnames = [skills_file, run_after_file, run_before_file] + _glob(aion_data_path + "/**/*.lng", recursive=True) + _glob(aion_data_path + "/**/*.acph", recursive=True)
+    return [compile_xml_snapshot(fname) for fname in fnames if isfile(fname)]
+
+
+class XMLDocumentCache:
+    """
+    a process-wide lru cache of parsed '.xml' files.
+    a cached document is validated against the (mtime, size, inode) signature of its file on every access, so a modified or replaced file is parsed again
+
+    :since: 0.2.0
+    """
+
+    def __init__(self, max_size: int = 32) -> None:
+        """
+        :param max_size: int, optional
+            maximal number of cached documents
+            syntax: <size>
+            example: 32
+        :return: None
+
+        :since: 0.2.0
+        """
+        self.max_size = max_size
+
+        self._documents = _OrderedDict()
+        self._lock = _RLock()
+
+    def get(self, fname: str) -> XMLDocument:
+        """
+        returns the parsed document of a file, parses it only if it isn't cached or has changed since it was cached
+
+        :param fname: str
+            filename of the file you want to get
+            syntax: <filename>
+            example: "/home/pi/test.xml"
+        :return: XMLDocument
+            returns the parsed document
+            NOTE: the document is shared, so don't change its elements. use 'copy.deepcopy' on the root element if you have to
+
+        :since: 0.2.0
+        """
+        from os.path import abspath
+
+        fname = abspath(fname)
+        signature = _document_signature(fname)
+        if signature[0] is None:
+            self.invalidate(fname)
+            raise FileNotFoundError("the file " + fname + " doesn't exist")
+
+        with self._lock:
+            document = self._documents.get(fname)
+            if document is not None and document.signature == signature:
+                self._documents.move_to_end(fname)
+                return document
+
+        document = None
+        if signature[1] is None:
+            document = _load_snapshot(fname, signature)
+        if document is None:
+            root = _strip_whitespace(_ET.parse(fname).getroot())
+            if signature[1] is not None:
+                _replay_journal(fname, root, signature[0])
+            document = XMLDocument(fname, root, signature)
+        self._store(document)
+        return document
+
+    def cached(self, fname: str) -> XMLDocument:
+        """
+        returns the parsed document of a file only if it is cached and the file hasn't changed since, the file is never parsed
+
+        :param fname: str
+            filename of the file you want to get
+            syntax: <filename>
+            example: "/home/pi/test.xml"
+        :return: XMLDocument
+            returns the parsed document or None if it isn't cached (anymore)
+
+        :since: 0.2.0
+        """
+        from os.path import abspath
+
+        fname = abspath(fname)
+        with self._lock:
+            document = self._documents.get(fname)
+        if document is not None and document.signature == _document_signature(fname):
+            return document
+        return None
+
+    def invalidate(self, fname: str = None) -> None:
+        """
+        removes a file from the cache
+
+        :param fname: str, optional
+            filename of the file you want to remove. if not given, the whole cache is cleared
+            syntax: <filename>
+            example: "/home/pi/test.xml"
+        :return: None
+
+        :since: 0.2.0
+        """
+        from os.path import abspath
+
+        with self._lock:
+            if fname is None:
+                self._documents.clear()
+            else:
+                self._documents.pop(abspath(fname), None)
+
+    def put(self, fname: str, root: _ET.Element) -> XMLDocument:
+        """
+        stores an already known root element of a file (e.g. after the file was written), so the file doesn't need to be parsed again
+
+        :param fname: str
+            filename of the file the root element belongs to
+            syntax: <filename>
+            example: "/home/pi/test.xml"
+        :param root: xml.etree.ElementTree.Element
+            root element of the file
+            NOTE: the element is shared after this call, so don't change it anymore
+        :return: XMLDocument
+            returns the stored document
+
+        :since: 0.2.0
+        """
+        from os.path import abspath
+
+        fname = abspath(fname)
+        signature = _document_signature(fname)
+        if signature[0] is None:
+            self.invalidate(fname)
+            raise FileNotFoundError("the file " + fname + " doesn't exist")
+
+        document = XMLDocument(fname, root, signature)
+        self._store(document)
+        return document
+
+    def _store(self, document: XMLDocument) -> None:
+        """
+        stores a document and removes the least recently used documents if the cache is full
+
+        :param document: XMLDocument
+            document to store
+        :return: None
+
+        :since: 0.2.0
+        """
+        with self._lock:
+            self._documents[document.fname] = document
+            self._documents.move_to_end(document.fname)
+            while len(self._documents) > max(self.max_size, 0):
+                self._documents.popitem(last=False)
+
+
+document_cache = XMLDocumentCache()
+
+
+def invalidate_xml_cache(fname: str = None) -> None:
+    """
+    removes a file (or all files) from the cache of parsed '.xml' files.
+    only needed if a file was changed in a way its (mtime, size, inode) signature doesn't notice
+
+    :param fname: str, optional
+        filename of the file you want to remove from the cache. if not given, the whole cache is cleared
+        syntax: <filename>
+        example: "/home/pi/test.xml"
+    :return: None
+
+    :since: 0.2.0
+    """
+    document_cache.invalidate(fname)
+
+
+def _document_signature(fname: str) -> tuple:
+    """
+    returns the signature of a '.xml' file together with the signature of its journal
+
+    :param fname: str
+        path of the file
+        syntax: <filename>
+        example: "/home/pi/test.xml"
+    :return: tuple
+        returns the signatures (see '_file_signature')
+        syntax: (<file signature>, <journal signature>)
+        example: ((1591360271000000000, 2048, 393219), None)
+
+    :since: 0.2.0
+    """
+    return _file_signature(fname), _file_signature(fname + ".journal")
+
+
+def _apply_record(root: _ET.Element, record: dict, index: XMLIndex = None) -> None:
+    """
+    applies a change of 'BaseXMLWriter' to a xml tree
+
+    :param root: xml.etree.ElementTree.Element
+        root element of the tree
+    :param record: dict
+        the change
+        syntax: {"action": <"add", "remove" or "update">, "parent_tag": <parent tag>, "elem_tag": <element tag>, "text": <text>, "attrib": {<attributes>}, "parent_attrib": {<parent attributes>}}
+        example: {"action": "add", "parent_tag": "<root>", "elem_tag": "sub_child", "text": "This is a sub element", "attrib": {}, "parent_attrib": None}
+    :param index: XMLIndex, optional
+        index of the tree, which is used to find the elements and is updated with the change
+        NOTE: if not given, an index is build for this change only
+    :return: None
+
+    :since: 0.2.0
+    """
+    if index is None:
+        index = XMLIndex(root)
+
+    parent_tag = record["parent_tag"]
+    elem_tag = record["elem_tag"]
+    parent_attrib = record["parent_attrib"]
+
+    if parent_tag == "<root>":
+        parent_tag = root.tag
+
+    if record["action"] == "add" and parent_tag == root.tag:
+        parents = [root] if not parent_attrib or root.attrib == parent_attrib else []
+    elif parent_attrib:
+        parents = index.find(parent_tag, parent_attrib)
+    else:
+        parents = index.elements(parent_tag)
+
+    if record["action"] == "add":
+        for parent in parents:
+            element = _ET.SubElement(parent, elem_tag, record["attrib"])
+            if record["text"]:
+                element.text = record["text"]
+            index.add(element, parent)
+        return
+
+    if sum(len(parent) for parent in parents) <= index.count(elem_tag):
+        childs = [(parent, child) for parent in parents for child in parent if child.tag == elem_tag]
+    else:
+        parents = set(parents)
+        childs = [(index.parent(child), child) for child in index.elements(elem_tag) if index.parent(child) in parents]
+    if record["action"] == "remove":
+        for parent, child in childs:
+            # the child may already be removed together with a removed ancestor
+            if child in index:
+                parent.remove(child)
+                index.remove(child)
+    elif record["action"] == "update":
+        for parent, child in childs:
+            if record["text"]:
+                child.text = str(record["text"])
+            if record["attrib"]:
+                old_attrib = dict(child.attrib)
+                for key, value in record["attrib"].items():
+                    child.set(str(key), str(value))
+                index.update_attrib(child, old_attrib)
+    else:
+        raise ValueError("unknown action '" + str(record["action"]) + "'")
+
+
+def _append_journal(fname: str, records: list) -> None:
+    """
+    appends changes to the journal of a file
+
+    :param fname: str
+        path of the file
+        syntax: <filename>
+        example: "/home/pi/test.xml"
+    :param records: list
+        the changes (see '_apply_record')
+    :return: None
+
+    :since: 0.2.0
+    """
+    from json import dumps
+    from os import fsync
+
+    lines = []
+    if _file_signature(fname + ".journal") is None or _read_journal_header(fname) != list(_file_signature(fname)):
+        _remove_journal(fname)
+        lines.append(dumps({"base": _file_signature(fname)}))
+    for record in records:
+        lines.append(dumps(record, default=str))
+
+    with open(fname + ".journal", "a") as file:
+        file.write("\n".join(lines) + "\n")
+        file.flush()
+        if _variables.xml_fsync_policy != "never":
+            fsync(file.fileno())
+
+
+def _read_journal_header(fname: str) -> list:
+    """
+    returns the signature of the file for which the journal of the file was started
+
+    :param fname: str
+        path of the file
+        syntax: <filename>
+        example: "/home/pi/test.xml"
+    :return: list
+        returns the signature of the file (see '_file_signature') or None if the journal has no valid header
+        syntax: [<mtime in nanoseconds>, <size>, <inode>]
+        example: [1591360271000000000, 2048, 393219]
+
+    :since: 0.2.0
+    """
+    from json import loads
+
+    with open(fname + ".journal", "r") as file:
+        try:
+            return loads(file.readline())["base"]
+        except (KeyError, TypeError, ValueError):
+            return None
+
+
+def _remove_journal(fname: str) -> None:
+    """
+    removes the journal of a file
+
+    :param fname: str
+        path of the file
+        syntax: <filename>
+        example: "/home/pi/test.xml"
+    :return: None
+
+    :since: 0.2.0
+    """
+    from os import unlink
+
+    try:
+        unlink(fname + ".journal")
+    except FileNotFoundError:
+        pass
+
+
+def _replay_journal(fname: str, root: _ET.Element, signature: tuple) -> None:
+    """
+    applies all changes in the journal of a file to the tree of the file.
+    a journal which was started for an older version of the file (e.g. the file was written completely afterwards) is ignored
+
+    :param fname: str
+        path of the file
+        syntax: <filename>
+        example: "/home/pi/test.xml"
+    :param root: xml.etree.ElementTree.Element
+        root element of the parsed file
+    :param signature: tuple
+        signature of the parsed file (see '_file_signature')
+        syntax: (<mtime in nanoseconds>, <size>, <inode>)
+        example: (1591360271000000000, 2048, 393219)
+    :return: None
+
+    :since: 0.2.0
+    """
+    from json import loads
+
+    try:
+        file = open(fname + ".journal", "r")
+    except FileNotFoundError:
+        return
+    with file:
+        try:
+            if loads(file.readline())["base"] != list(signature):
+                return
+        except (KeyError, TypeError, ValueError):
+            return
+        index = XMLIndex(root)
+        for line in file:
+            try:
+                record = loads(line)
+            except ValueError:
+                # a partly written last record of an interrupted write
+                break
+            _apply_record(root, record, index)
+
+
+def _escape_pretty(data: str) -> str:
+    """
+    escapes a text or attribute value the same way 'xml.dom.minidom' does it
+
+    :param data: str
+        text to escape
+        syntax: <text>
+        example: "a < b"
+    :return: str
+        returns the escaped text
+        syntax: <escaped text>
+        example: "a &lt; b"
+
+    :since: 0.2.0
+    """
+    if "&" in data:
+        data = data.replace("&", "&amp;")
+    if "<" in data:
+        data = data.replace("<", "&lt;")
+    if "\"" in data:
+        data = data.replace("\"", "&quot;")
+    if ">" in data:
+        data = data.replace(">", "&gt;")
+    return data
+
+
+def _normalize_text(text: str) -> str:
+    """
+    normalizes the line endings of a text like a xml parser does
+
+    :param text: str
+        text to normalize
+        syntax: <text>
+        example: "first line\r\nsecond line"
+    :return: str
+        returns the normalized text
+        syntax: <text>
+        example: "first line\nsecond line"
+
+    :since: 0.2.0
+    """
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _can_write_pretty(root: _ET.Element) -> bool:
+    """
+    checks if a tree can be written with '_write_pretty' (trees with namespaces or processing instructions can't)
+
+    :param root: xml.etree.ElementTree.Element
+        root element of the tree
+    :return: bool
+        returns True if the tree can be written / False if not
+        syntax: <boolean>
+        example: True
+
+    :since: 0.2.0
+    """
+    for element in root.iter():
+        tag = element.tag
+        if tag is _ET.ProcessingInstruction or (tag is not _ET.Comment and (not isinstance(tag, str) or tag[:1] == "{")):
+            return False
+        for key in element.attrib:
+            if key[:1] == "{":
+                return False
+    return True
+
+
+@_contextmanager
+def _open_write(fname: str, mode: str = "w"):
+    """
+    opens a file for writing, so that the file is replaced atomically when the returned file is closed without an error.
+    readers of the file see either the old or the complete new content, but never a partly written file.
+    how much is synced to the disk depends on the policy set with 'set_xml_fsync_policy'
+
+    :param fname: str
+        filename of the file you want to write
+        syntax: <filename>
+        example: "/home/pi/test.xml"
+    :param mode: str, optional
+        mode to write on file
+        syntax: <mode>
+        example: "w"
+        NOTE: files opened in append ('a') or update ('+') mode are written in place
+    :return: a context manager which returns the opened file
+
+    :since: 0.2.0
+    """
+    from os import O_CREAT, O_EXCL, O_WRONLY, chmod, chown, close, fdopen, fsync, getpid, open as os_open, replace, stat, unlink
+    from os.path import abspath, basename, dirname, isfile
+    from random import randrange
+
+    if "a" in mode or "+" in mode:
+        with open(fname, mode=mode) as file:
+            yield file
+        return
+
+    if "x" in mode and isfile(fname):
+        raise FileExistsError("the file " + fname + " already exist")
+
+    fname = abspath(fname)
+    directory = dirname(fname)
+    tmp_fname = directory + "/." + basename(fname) + "." + str(getpid()) + "." + str(randrange(16 ** 8)) + ".tmp"
+
+    fd = os_open(tmp_fname, O_WRONLY | O_CREAT | O_EXCL, 0o666)
+    try:
+        try:
+            stat_result = stat(fname)
+            chmod(tmp_fname, stat_result.st_mode & 0o7777)
+            try:
+                chown(tmp_fname, stat_result.st_uid, stat_result.st_gid)
+            except PermissionError:
+                pass
+        except FileNotFoundError:
+            pass
+
+        with fdopen(fd, mode.replace("x", "w")) as file:
+            fd = None
+            yield file
+            file.flush()
+            if _variables.xml_fsync_policy != "never":
+                fsync(file.fileno())
+        replace(tmp_fname, fname)
+    except BaseException:
+        if fd is not None:
+            close(fd)
+        try:
+            unlink(tmp_fname)
+        except FileNotFoundError:
+            pass
+        raise
+
+    if _variables.xml_fsync_policy == "full":
+        directory_fd = os_open(directory, 0)
+        try:
+            fsync(directory_fd)
+        finally:
+            close(directory_fd)
+
+
+def set_xml_fsync_policy(policy: str) -> None:
+    """
+    set how much of a written '.xml' file is synced to the disk before it replaces the old file ('file' is default)
+
+    :param policy: str
+        the fsync policy
+        syntax: <policy>
+        example: "full"
+        NOTE: the policies are:
+                "never"  nothing is synced, the file is only replaced atomically. fastest, but the file may be empty after a power loss
+                "file"   the content of the file is synced before it replaces the old file. after a power loss the file contains the old or the new content
+                "full"   like 'file', but also the directory is synced after the file was replaced, so that the new content is durable once the write returns
+    :return: None
+
+    :since: 0.2.0
+    """
+    if policy not in ("never", "file", "full"):
+        raise ValueError("policy must be 'never', 'file' or 'full', got '" + str(policy) + "'")
+    _variables.xml_fsync_policy = policy
+
+
+_xml_name = _compile(r"(?!\d)[\w:][\w.:-]*\Z")
+
+
+def _validate_tree(root: _ET.Element) -> None:
+    """
+    checks if a tree can be written as valid xml
+
+    :param root: xml.etree.ElementTree.Element
+        root element of the tree to check
+    :return: None
+
+    :since: 0.2.0
+    """
+    for element in root.iter():
+        if element.tag is _ET.Comment or element.tag is _ET.ProcessingInstruction:
+            continue
+        if not isinstance(element.tag, str) or _xml_name.match(element.tag) is None:
+            raise ValueError("'" + str(element.tag) + "' isn't a valid element name")
+        for key, value in element.attrib.items():
+            if not isinstance(key, str) or _xml_name.match(key) is None:
+                raise ValueError("'" + str(key) + "' isn't a valid attribute name (element '" + element.tag + "')")
+            if not isinstance(value, str):
+                raise TypeError("value of attribute '" + key + "' (element '" + element.tag + "') must be str, got " + type(value).__name__)
+        if element.text is not None and not isinstance(element.text, str):
+            raise TypeError("text of element '" + element.tag + "' must be str, got " + type(element.text).__name__)
+
+
+def _write_pretty(element: _ET.Element, write, indent: str = "") -> None:
+    """
+    writes a pretty printed element in a single pass.
+    the output is the same as from 'xml.dom.minidom.Node.toprettyxml(indent="  ")' without the xml declaration
+
+    :param element: xml.etree.ElementTree.Element
+        element to write
+    :param write: function
+        function which gets called with every part of the output, e.g. the 'write' method of a file
+    :param indent: str, optional
+        indentation of the element
+        syntax: <indent>
+        example: "  "
+    :return: None
+
+    :since: 0.2.0
+    """
+    tag = element.tag
+    if tag is _ET.Comment:
+        write(indent + "<!--" + (element.text or "") + "-->\n")
+        return
+
+    write(indent + "<" + tag)
+    for key, value in element.attrib.items():
+        write(" " + key + "=\"" + _escape_pretty(value) + "\"")
+
+    text = element.text
+    if len(element) == 0:
+        if text:
+            write(">" + _escape_pretty(_normalize_text(text)) + "</" + tag + ">\n")
+        else:
+            write("/>\n")
+        return
+
+    write(">\n")
+    child_indent = indent + "  "
+    if text:
+        write(child_indent + _escape_pretty(_normalize_text(text)) + "\n")
+    for child in element:
+        _write_pretty(child, write, child_indent)
+        if child.tail:
+            write(child_indent + _escape_pretty(_normalize_text(child.tail)) + "\n")
+    write(indent + "</" + tag + ">\n")
+
+
 class BaseXMLBuilder:
     """
     a class to simple build a '.xml' file
@@ -129,6 +1356,10 @@ class BaseXMLBuilder:
         :since: 0.1.0
         """
         if string is None:
+            if _can_write_pretty(self._root):
+                output = _StringIO()
+                _write_pretty(self._root, output.write)
+                return output.getvalue()
             reparsed = _minidom.parseString(_ET.tostring(self._root, "utf-8"))
         else:
             reparsed = _minidom.parseString(bytes(string, "utf-8", errors="ignore"))
@@ -159,10 +1390,9 @@ class BaseXMLBuilder:
 
         :since: 0.1.0
         """
+        element = _ET.Element(name, attrib, **extra)
         if text:
-            element = _ET.Element(name, attrib, **extra).text = text
-        else:
-            element = _ET.Element(name, attrib, **extra)
+            element.text = text
 
         self._root.append(element)
         self._element_list.append(name)
@@ -262,312 +1492,313 @@ class BaseXMLBuilder:
 
         :since: 0.1.0
         """
-        with open(fname, mode=mode) as file:
-            file.write(self.get_string(pretty_print))
-            file.close()
+        with _open_write(fname, mode) as file:
+            if pretty_print is True and _can_write_pretty(self._root):
+                _write_pretty(self._root, file.write)
+            else:
+                file.write(self.get_string(pretty_print))
+        _remove_journal(fname)
 
+        document_cache.invalidate(fname)
 
-class BaseXMLReader:
 
+class XMLInfos(_Mapping):
     """
-    a class to simple reead '.xml' file
+    a read-only dict like class with indexing items, which contains the infos about elements of a xml file.
+    the infos are read from the elements of the document when they are accessed, nothing is copied before
 
     :since: 0.1.0
     """
 
-    def __init__(self, fname: str) -> None:
+    def __init__(self, document: XMLDocument, elem_tags: (str, list) = []) -> None:
         """
-        makes the fname and auto_write available for all class methods and set all variables
-
-        :param fname: str
-            filename of the file you want to read
-            syntax: <filename>
-            example: "/home/pi/test.xml"
+        get infos about an element in the file
+
+        :param document: XMLDocument
+            document from which the infos are taken
+        :param elem_tags: list
+            name of elements you want to get infos about
+            syntax: [<element tags>]
+            example: ["sub_child"]
         :return: None
 
         :since: 0.1.0
         """
-        self.fname = fname
+        if isinstance(elem_tags, str):
+            elem_tags = [elem_tags]
+
+        self._document = document
+        self._all = "<all>" in elem_tags
+
+        keys = {}
+        for elem in elem_tags:
+            if elem == "<all>":
+                continue
+            elif elem == "<root>":
+                keys[document.root_tag] = None
+            else:
+                keys[elem] = None
+        if self._all:
+            for tag in document.tags():
+                keys[tag] = None
 
-        self._tree = _ET.parse(self.fname)
-        self._root = self._tree.getroot()
+        self._keys = tuple(keys)
+        self._values = {}
 
-        self.get_infos._root = self._root
+    def __getitem__(self, key: str) -> "XMLInfoList":
+        try:
+            return self._values[key]
+        except KeyError:
+            if key not in self._keys:
+                raise
+            value = self._values[key] = XMLInfoList(self._document, key, self._all)
+            return value
 
-    def _prettify(self, string: str = None) -> str:
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+    def __str__(self):
+        return str(dict(self.items()))
+
+    def index(self, index: int) -> dict:
         """
-        prettifies the given string
+        index a key-value pair in a dict
+
+        :param index: int
+            index of the key-value pair you want to get
+            syntax: <index>
+            example: 5
+        :return: dict
+            returns the key-value pair of the given index
+            syntax: {<key>: <value>}
+            example: {"test_key": "test_value"}
 
-        :param string: str
-            string to prettify
-            syntax: <string>
-            example: "<root><test_element></test_element></root>"
-        :return: str
-            returns the_prettified string
-            syntax: <string>
-            example: "<root>
-                        <test_element>
-                        </test_element>
-                      </root>"
+        :since: 0.1.0
+        """
+        try:
+            key = self._keys[index]
+        except IndexError:
+            raise IndexError("dict index out of range")
+        return {key: self[key]}
+
+    def items(self) -> "_IndexedItemsView":
+        """
+        a modified items() function from dict with indexing items
 
         :since: 0.1.0
         """
-        if string is None:
-            reparsed = _minidom.parseString(_ET.tostring(self._root, "utf-8"))
-        else:
-            reparsed = _minidom.parseString(bytes(string, "utf-8", errors="ignore"))
-        pre_output = reparsed.toprettyxml(indent="  ")
-        return "\n".join(pre_output.split("\n")[1:])
+        return _IndexedItemsView(self)
 
-    class get_infos(dict):
+    def keys(self) -> "_IndexedKeysView":
         """
-        a modified dict class with indexing items
+        a modified keys() function from dict with indexing items
 
         :since: 0.1.0
         """
+        return _IndexedKeysView(self)
 
-        def __init__(self, elem_tags: (str, list) = []) -> dict:
-            """
-            get infos about an element in the file
-
-            :param elem_tags: list
-                name of elements you want to get infos about
-                syntax: [<element tags>]
-                example: ["sub_child"]
-            :return: dict
-                returns a dict of names from the given elements with a list of dictionaries of found elements (complex description xD)
-                syntax: {<element>: [{"parent": {"tag": <parent tag>, "text": <text of the parent element>, "attrib": {<attributes of the parent element>}}, "childs": [<childs of the element>], "tag": <tag of the element>, "text": <text of the element>, "attrib": {<attributes of the element>}}]}
-                example: {"sub_child": [{"parent": {"tag": "root_child", "text": "", "attrib": {"author": "blueShard"}}, "childs": ["sub_child"], "tag": "sub_child", "text": "This is a sub element", "attrib": {}}]}
-
-            :since: 0.1.0
-            """
-            if isinstance(elem_tags, str):
-                elem_tags = [elem_tags]
-
-            child_list = []
-            return_dict = {}
-            for elem in elem_tags:
-                if elem == "<all>":
-                    continue
-                elif elem == "<root>":
-                    return_dict[self._root.tag] = []
-                else:
-                    return_dict[elem] = []
+    def values(self) -> "_IndexedValuesView":
+        """
+        a modified values() function from dict with indexing items
 
-            all_child_list = []
+        :since: 0.1.0
+        """
+        return _IndexedValuesView(self)
 
-            if "<all>" in elem_tags:
-                if self._root.tag in return_dict:
-                    pass
-                else:
-                    return_dict[self._root.tag] = []
-                return_dict[self._root.tag].append(
-                    {"parent": {"tag": "", "text": "", "attrib": {}}, "childs": [child.tag for child in self._root], "tag": self._root.tag, "text": "", "attrib": self._root.attrib})
-                for root_child in self._root:
-                    if root_child.tag in return_dict:
-                        pass
-                    else:
-                        return_dict[root_child.tag] = []
-                    return_dict[root_child.tag].append(
-                        {"parent": {"tag": self._root.tag, "text": self._root.text, "attrib": self._root.attrib}, "childs": [sub_root_child.tag for sub_root_child in root_child],
-                         "tag": root_child.tag, "text": root_child.text, "attrib": root_child.attrib})
-                    all_child_list.append(root_child)
-                for parent in list(all_child_list):
-                    for child in parent:
-                        if child.tag in return_dict:
-                            pass
-                        else:
-                            return_dict[child.tag] = []
-                        return_dict[child.tag].append(
-                            {"parent": {"tag": parent.tag, "text": parent.text, "attrib": parent.attrib}, "childs": [sub_child.tag for sub_child in child], "tag": child.tag, "text": child.text,
-                             "attrib": child.attrib})
-                        all_child_list.append(child)
-                        if child in all_child_list:
-                            all_child_list.remove(child)
-            else:
-                if self._root.tag in return_dict:
-                    return_dict[self._root.tag].append({"parent": {}, "childs": [child.tag for child in self._root], "tag": self._root.tag, "text": "", "attrib": self._root.attrib})
-                for root_child in self._root:
-                    if root_child.tag in return_dict:
-                        return_dict[root_child.tag].append(
-                            {"parent": {"tag": self._root.tag, "text": self._root.text, "attrib": self._root.attrib}, "childs": [sub_root_child.tag for sub_root_child in root_child],
-                             "tag": root_child.tag, "text": root_child.text, "attrib": root_child.attrib})
-                    else:
-                        child_list.append(root_child)
-                for parent in list(child_list):
-                    for child in parent:
-                        if child.tag in return_dict:
-                            return_dict[child.tag].append(
-                                {"parent": {"tag": parent.tag, "text": parent.text, "attrib": parent.attrib}, "childs": [sub_child.tag for sub_child in child], "tag": child.tag, "text": child.text,
-                                 "attrib": child.attrib})
-                        else:
-                            child_list.append(child)
-                        if child in child_list:
-                            child_list.remove(child)
-
-            self._return_dict = return_dict
-
-            self.items._return_dict_keys = return_dict.keys()
-            self.items._return_dict_values = return_dict.values()
-            self.keys._return_dict_keys = return_dict.keys()
-            self.values._return_dict_values = return_dict.values()
-
-            super().__init__(self._return_dict)
-
-        def __iter__(self):
-            return iter(self._return_dict)
-
-        def __next__(self):
-            return self._return_dict
-
-        def __repr__(self):
-            return self._return_dict
-
-        def __str__(self):
-            return str(self._return_dict)
-
-        def index(self, index: int) -> dict:
-            """
-            index a key-value pair in a dict
-
-            :param index: int
-                index of the key-value pair you want to get
-                syntax: <index>
-                example: 5
-            :return: dict
-                returns the key-value pair of the given index
-                syntax: {<key>: <value>}
-                example: {"test_key": "test_value"}
-
-            :since: 0.1.0
-            """
-            i = 0
-            for key, value in self._return_dict.items():
-                if i == index:
-                    return {key: value}
-                else:
-                    i += 1
-            raise IndexError("dict index out of range")
 
-        class items:
-            """
-            a modified items() function from dict with indexing items
+class XMLInfoList(_Sequence):
+    """
+    a read-only list like class of the infos about all elements with the same tag.
+    an info dict is only created if it is accessed
 
-            :since: 0.1.0
-            """
+    :since: 0.2.0
+    """
 
-            def __init__(self):
-                pass
+    def __init__(self, document: XMLDocument, tag: str, all_elements: bool = False) -> None:
+        """
+        :param document: XMLDocument
+            document from which the infos are taken
+        :param tag: str
+            tag of the elements
+            syntax: <tag>
+            example: "sub_child"
+        :param all_elements: bool, optional
+            sets if the infos were requested with '<all>', which only changes the parent infos of the root element
+            syntax: <boolean>
+            example: False
+        :return: None
 
-            def __getitem__(self, item):
-                return tuple(self._return_dict_items)[item]
+        :since: 0.2.0
+        """
+        self._all = all_elements
+        self._document = document
+        self._elements = document.elements(tag)
 
-            def __iter__(self):
-                return iter(self._return_dict_items)
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return [self._document.infos(element, self._all) for element in self._elements[item]]
+        return self._document.infos(self._elements[item], self._all)
 
-            def __len__(self):
-                return len(self._return_dict_items)
+    def __len__(self):
+        return len(self._elements)
 
-            def __next__(self):
-                return self._return_dict_items
+    def __repr__(self):
+        return repr(list(self))
 
-            def __repr__(self):
-                return self._return_dict_items
+    def __str__(self):
+        return str(list(self))
 
-            def __str__(self):
-                return str(self._return_dict_items)
 
-            def index(self, index: int):
-                """
-                index a key-value pair in a dict
+class _IndexedItemsView(_ItemsView):
+    """
+    a modified items() view from dict with indexing items
 
-                :param index: int
-                    index of the key-value pair you want to get
-                    syntax: <index>
-                    example: 5
-                :return: the given index in the values
+    :since: 0.1.0
+    """
 
-                :since: 0.1.0
-                """
-                return {list(self._return_dict_keys)[index]: list(self._return_dict_values)[index]}
+    def __getitem__(self, item):
+        key = self._mapping._keys[item]
+        return key, self._mapping[key]
 
-        class keys:
-            """
-            a modified keys() function from dict with indexing items
+    def index(self, index: int) -> dict:
+        """
+        index a key-value pair in a dict
 
-            :since: 0.1.0
-            """
+        :param index: int
+            index of the key-value pair you want to get
+            syntax: <index>
+            example: 5
+        :return: the given index in the values
 
-            def __init__(self):
-                pass
+        :since: 0.1.0
+        """
+        return self._mapping.index(index)
 
-            def __iter__(self):
-                return iter(self._return_dict_keys)
 
-            def __len__(self):
-                return len(list(self._return_dict_keys))
+class _IndexedKeysView(_KeysView):
+    """
+    a modified keys() view from dict with indexing items
+
+    :since: 0.1.0
+    """
 
-            def __next__(self):
-                return self._return_dict_keys
+    def index(self, index: int):
+        """
+        index a key in a dict
 
-            def __repr__(self):
-                return self._return_dict_keys
+        :param index: int
+            index of the key you want to get
+            syntax: <index>
+            example: 5
+        :return: the given index in the keys
 
-            def __str__(self):
-                return str(self._return_dict_keys)
+        :since: 0.1.0
+        """
+        return self._mapping._keys[index]
 
-            def index(self, index: int):
-                """
-                index a key in a dict
 
-                :param index: int
-                    index of the key you want to get
-                    syntax: <index>
-                    example: 5
-                :return: the given index in the keys
+class _IndexedValuesView(_ValuesView):
+    """
+    a modified values() view from dict with indexing items
 
-                :since: 0.1.0
-                """
-                return list(self._return_dict_keys)[index]
+    :since: 0.1.0
+    """
 
-        class values:
-            """
-            a modified values() function from dict with indexing items
+    def index(self, index: int):
+        """
+        index a value in a dict
 
-            :since: 0.1.0
-            """
+        :param index: int
+            index of the value you want to get
+            syntax: <index>
+            example: 5
+        :return: the given index in the values
 
-            def __init__(self):
-                pass
+        :since: 0.1.0
+        """
+        return self._mapping[self._mapping._keys[index]]
 
-            def __iter__(self):
-                return iter(self._return_dict_values)
 
-            def __len__(self):
-                return len(list(self._return_dict_values))
+class BaseXMLReader:
+
+    """
+    a class to simple reead '.xml' file
+
+    :since: 0.1.0
+    """
+
+    def __init__(self, fname: str) -> None:
+        """
+        makes the fname and auto_write available for all class methods and set all variables
+
+        :param fname: str
+            filename of the file you want to read
+            syntax: <filename>
+            example: "/home/pi/test.xml"
+        :return: None
+
+        :since: 0.1.0
+        """
+        self.fname = fname
+
+        self._document = document_cache.get(self.fname)
 
-            def __next__(self):
-                return self._return_dict_values
+    @property
+    def _root(self) -> _ET.Element:
+        return self._document.root
 
-            def __repr__(self):
-                return self._return_dict_values
+    def _prettify(self, string: str = None) -> str:
+        """
+        prettifies the given string
 
-            def __str__(self):
-                return str(self._return_dict_values)
+        :param string: str
+            string to prettify
+            syntax: <string>
+            example: "<root><test_element></test_element></root>"
+        :return: str
+            returns the_prettified string
+            syntax: <string>
+            example: "<root>
+                        <test_element>
+                        </test_element>
+                      </root>"
 
-            def index(self, index: int):
-                """
-                index a value in a dict
+        :since: 0.1.0
+        """
+        if string is None:
+            if _can_write_pretty(self._root):
+                output = _StringIO()
+                _write_pretty(self._root, output.write)
+                return output.getvalue()
+            reparsed = _minidom.parseString(_ET.tostring(self._root, "utf-8"))
+        else:
+            reparsed = _minidom.parseString(bytes(string, "utf-8", errors="ignore"))
+        pre_output = reparsed.toprettyxml(indent="  ")
+        return "\n".join(pre_output.split("\n")[1:])
 
-                :param index: int
-                    index of the value you want to get
-                    syntax: <index>
-                    example: 5
-                :return: the given index in the values
+    def get_infos(self, elem_tags: (str, list) = []) -> XMLInfos:
+        """
+        get infos about an element in the file
+
+        :param elem_tags: list
+            name of elements you want to get infos about
+            syntax: [<element tags>]
+            example: ["sub_child"]
+            NOTE: '<root>' stands for the root element, '<all>' for all elements
+        :return: XMLInfos
+            returns a dict of names from the given elements with a list of dictionaries of found elements (complex description xD)
+            syntax: {<element>: [{"parent": {"tag": <parent tag>, "text": <text of the parent element>, "attrib": {<attributes of the parent element>}}, "childs": [<childs of the element>], "tag": <tag of the element>, "text": <text of the element>, "attrib": {<attributes of the element>}}]}
+            example: {"sub_child": [{"parent": {"tag": "root_child", "text": "", "attrib": {"author": "blueShard"}}, "childs": ["sub_child"], "tag": "sub_child", "text": "This is a sub element", "attrib": {}}]}
 
-                :since: 0.1.0
-                """
-                return list(self._return_dict_values)[index]
+        :since: 0.1.0
+        """
+        return XMLInfos(self._document, elem_tags)
 
     def get_string(self, pretty_print: bool = True) -> str:
         """
@@ -601,6 +1832,129 @@ class BaseXMLReader:
                 return string
 
 
+class BaseXMLStreamReader:
+    """
+    a class to read big '.xml' files element by element without loading the whole file into memory.
+    every element is removed from the tree after it was processed
+
+    :since: 0.2.0
+    """
+
+    def __init__(self, fname: str) -> None:
+        """
+        :param fname: str
+            filename of the file you want to read
+            syntax: <filename>
+            example: "/home/pi/test.xml"
+        :return: None
+
+        :since: 0.2.0
+        """
+        self.fname = fname
+
+    def exist_child(self, parent_tag: str, elem_tag: str) -> bool:
+        """
+        checks if an element is a child of an element with the given parent tag.
+        the file is only read until the element was found, if the file is already in the xml cache it isn't read at all
+
+        :param parent_tag: str
+            name of the parent element
+            syntax: <parent name>
+            example: "<root>"
+            NOTE: '<root>' stands for the root element
+        :param elem_tag: str
+            name of the element
+            syntax: <element name>
+            example: "sub_child"
+        :return: bool
+            returns True if the element exist / False if not
+            syntax: <boolean>
+            example: True
+
+        :since: 0.2.0
+        """
+        document = document_cache.cached(self.fname)
+        if document is None and _file_signature(self.fname + ".journal") is not None:
+            document = document_cache.get(self.fname)
+        if document is not None:
+            return document.exist_child(parent_tag, elem_tag)
+
+        with open(self.fname, "rb") as file:
+            parents = []
+            for event, element in _ET.iterparse(file, ("start", "end")):
+                if event == "start":
+                    if parents and element.tag == elem_tag:
+                        if parents[-1].tag == parent_tag or (parent_tag == "<root>" and len(parents) == 1):
+                            return True
+                    parents.append(element)
+                else:
+                    parents.pop()
+                    if parents:
+                        parents[-1].remove(element)
+        return False
+
+    def get_infos(self, elem_tags: (str, list) = []):
+        """
+        yields infos about elements in the file in the order their end tags appear
+
+        :param elem_tags: list
+            name of elements you want to get infos about
+            syntax: [<element tags>]
+            example: ["sub_child"]
+            NOTE: '<root>' stands for the root element, '<all>' for all elements
+        :return: generator
+            yields a dictionary for every found element
+            syntax: {"parent": {"tag": <parent tag>, "text": <text of the parent element>, "attrib": {<attributes of the parent element>}}, "childs": [<childs of the element>], "tag": <tag of the element>, "text": <text of the element>, "attrib": {<attributes of the element>}}
+            example: {"parent": {"tag": "root_child", "text": "", "attrib": {"author": "blueShard"}}, "childs": [], "tag": "sub_child", "text": "This is a sub element", "attrib": {}}
+
+        :since: 0.2.0
+        """
+        if isinstance(elem_tags, str):
+            elem_tags = [elem_tags]
+
+        if _file_signature(self.fname + ".journal") is not None:
+            # the changes in the journal must be replayed on the whole tree
+            for info_list in BaseXMLReader(self.fname).get_infos(elem_tags).values():
+                yield from info_list
+            return
+
+        elem_tags = set(elem_tags)
+        all_elements = "<all>" in elem_tags
+
+        with open(self.fname, "rb") as file:
+            stack = []
+            for event, element in _ET.iterparse(file, ("start", "end")):
+                if event == "start":
+                    if stack and stack[-1][1] is not None:
+                        stack[-1][1].append(element.tag)
+                    if all_elements or element.tag in elem_tags or (not stack and "<root>" in elem_tags):
+                        stack.append((element, []))
+                    else:
+                        stack.append((element, None))
+                    continue
+
+                childs = stack.pop()[1]
+                if childs is not None:
+                    if stack:
+                        parent = stack[-1][0]
+                        text = element.text
+                        if text is not None and not text.strip():
+                            text = None
+                        parent_text = parent.text
+                        if parent_text is not None and not parent_text.strip():
+                            parent_text = None
+                        yield {"parent": {"tag": parent.tag, "text": parent_text, "attrib": _MappingProxyType(dict(parent.attrib))}, "childs": childs, "tag": element.tag, "text": text, "attrib": _MappingProxyType(dict(element.attrib))}
+                    elif all_elements:
+                        yield {"parent": {"tag": "", "text": "", "attrib": _empty_attrib}, "childs": childs, "tag": element.tag, "text": "", "attrib": _MappingProxyType(dict(element.attrib))}
+                    else:
+                        yield {"parent": {}, "childs": childs, "tag": element.tag, "text": "", "attrib": _MappingProxyType(dict(element.attrib))}
+
+                if stack:
+                    stack[-1][0].remove(element)
+                else:
+                    element.clear()
+
+
 class BaseXMLWriter:
     """
     a class to simple change/write a '.xml' file
@@ -608,7 +1962,7 @@ class BaseXMLWriter:
     :since: 0.1.0
     """
 
-    def __init__(self, fname: str, auto_write: bool = False) -> None:
+    def __init__(self, fname: str, auto_write: bool = False, journal: bool = False, journal_max_size: int = 65536) -> None:
         """
         :param fname: str
             filename of the file you want to write to
@@ -618,14 +1972,29 @@ class BaseXMLWriter:
             sets if after every change to the getted xml tree the changes should be write to the file
             syntax: <boolean>
             example: False
+        :param journal: bool, optional
+            sets if 'write' should only append the changes to a journal file ('<filename>.journal') instead of rewriting the whole file.
+            all readers and writers replay the journal over the file, so they see the changes anyway
+            syntax: <boolean>
+            example: True
+        :param journal_max_size: int, optional
+            size in bytes from which the journal is folded into the file (the whole file is written and the journal is removed)
+            syntax: <size>
+            example: 65536
         :return: None
 
         :since: 0.1.0
         """
         self.auto_write = auto_write
         self.fname = fname
+        self.journal = journal
+        self.journal_max_size = journal_max_size
 
-        self._root = _ET.fromstring("".join([item.replace("\n", "").strip() for item in [line for line in open(self.fname, "r")]]))
+        self._root = _deepcopy(document_cache.get(self.fname).root)
+        self._index = XMLIndex(self._root)
+
+        self._batch_depth = 0
+        self._journal_records = []
 
     def _prettify(self, string: str = None) -> str:
         """
@@ -647,12 +2016,33 @@ class BaseXMLWriter:
         :since: 0.1.0
         """
         if string is None:
+            if _can_write_pretty(self._root):
+                output = _StringIO()
+                _write_pretty(self._root, output.write)
+                return output.getvalue()
             reparsed = _minidom.parseString(_ET.tostring(self._root, "utf-8"))
         else:
             reparsed = _minidom.parseString(string)
         pre_output = reparsed.toprettyxml(indent="  ")
         return "\n".join(pre_output.split("\n")[1:])
 
+    def _apply(self, record: dict) -> None:
+        """
+        applies a change to the xml tree, remembers it for the journal and writes it if 'auto_write' is set
+
+        :param record: dict
+            the change (see '_apply_record')
+        :return: None
+
+        :since: 0.2.0
+        """
+        _apply_record(self._root, record, self._index)
+        if self.journal:
+            self._journal_records.append(record)
+
+        if self.auto_write is True and self._batch_depth == 0:
+            self.write()
+
     def add(self, parent_tag: str, elem_tag: str, text: str = None, attrib: dict = {}, parent_attrib: dict = None, **extra: str) -> None:
         """
         adds an element to xml tree
@@ -685,41 +2075,45 @@ class BaseXMLWriter:
 
         :since: 0.1.0
         """
-        if parent_tag == "<root>":
-            parent_tag = self._root.tag
+        self._apply({"action": "add", "parent_tag": parent_tag, "elem_tag": elem_tag, "text": text, "attrib": dict(attrib, **extra), "parent_attrib": parent_attrib})
 
-        if parent_tag == self._root.tag:
-            if parent_attrib:
-                if parent_attrib == self._root.attrib:
-                    if text:
-                        root_text_element = _ET.Element(elem_tag, attrib, **extra)
-                        root_text_element.text = text
-                        self._root.append(root_text_element)
-                    else:
-                        self._root.append(_ET.Element(elem_tag, attrib, **extra))
-            else:
-                if text:
-                    root_text_element = _ET.Element(elem_tag, attrib, **extra)
-                    root_text_element.text = text
-                    self._root.append(root_text_element)
-                else:
-                    self._root.append(_ET.Element(elem_tag, attrib, **extra))
-        else:
-            for parent in self._root.iter(parent_tag):
-                if parent_attrib:
-                    if parent.attrib == parent_attrib:
-                        if text:
-                            _ET.SubElement(parent, elem_tag).text = text
-                        else:
-                            _ET.SubElement(parent, elem_tag, attrib, **extra)
-                else:
-                    if text:
-                        _ET.SubElement(parent, elem_tag).text = text
-                    else:
-                        _ET.SubElement(parent, elem_tag, attrib, **extra)
+    @_contextmanager
+    def batch(self):
+        """
+        collects all changes made inside the 'with' block and writes them to the file at once when the block is left.
+        if an error occurs inside the block, all changes of the block are discarded and nothing is written
 
-        if self.auto_write is True:
-            self.write()
+        :return: a context manager
+
+        :example:
+            with writer.batch():
+                writer.add("<root>", "first_child")
+                writer.add("<root>", "second_child")
+
+        :since: 0.2.0
+        """
+        if self._batch_depth > 0:
+            self._batch_depth += 1
+            try:
+                yield self
+            finally:
+                self._batch_depth -= 1
+            return
+
+        snapshot = _deepcopy(self._root)
+        journal_length = len(self._journal_records)
+        self._batch_depth = 1
+        try:
+            yield self
+            _validate_tree(self._root)
+        except BaseException:
+            self._root = snapshot
+            self._index = XMLIndex(self._root)
+            del self._journal_records[journal_length:]
+            raise
+        finally:
+            self._batch_depth = 0
+        self.write()
 
     def get_string(self, pretty_print: bool = False) -> str:
         """
@@ -773,29 +2167,7 @@ class BaseXMLWriter:
 
         :since: 0.1.0
         """
-        if parent_tag == "<root>":
-            parent_tag = self._root.tag
-
-        if parent_tag == self._root.tag:
-            for child in self._root:
-                if child.tag == elem_tag:
-                    if parent_attrib:
-                        if self._root.attrib == parent_attrib:
-                            self._root.remove(child)
-                    else:
-                        self._root.remove(child)
-
-        for parent in self._root.iter(parent_tag):
-            for child in parent:
-                if child.tag == elem_tag:
-                    if parent_attrib:
-                        if parent.attrib == parent_attrib:
-                            parent.remove(child)
-                    else:
-                        parent.remove(child)
-
-        if self.auto_write is True:
-            self.write()
+        self._apply({"action": "remove", "parent_tag": parent_tag, "elem_tag": elem_tag, "parent_attrib": parent_attrib})
 
     def update(self, parent_tag: str, elem_tag: str, text: str = None, attrib: dict = {}, parent_attrib: dict = None, **extra: str) -> None:
         """
@@ -829,48 +2201,7 @@ class BaseXMLWriter:
 
         :since: 0.1.0
         """
-        if parent_tag == "<root>":
-            parent_tag = self._root.tag
-
-        if parent_tag == self._root.tag:
-            for child in self._root:
-                if child.tag == elem_tag:
-                    if parent_attrib:
-                        if self._root.attrib == parent_attrib:
-                            if text:
-                                child.text = str(text)
-                            for key, value in attrib.items():
-                                child.set(str(key), str(value))
-                            for key, value in extra.items():
-                                child.set(key, str(value))
-                    else:
-                        if text:
-                            child.text = str(text)
-                        for key, value in attrib.items():
-                            child.set(str(key), str(value))
-                        for key, value in extra.items():
-                            child.set(key, str(value))
-        for parent in self._root.iter(parent_tag):
-            for child in parent:
-                if child.tag == elem_tag:
-                    if parent_attrib:
-                        if parent.attrib == parent_attrib:
-                            if text:
-                                child.text = str(text)
-                            for key, value in attrib.items():
-                                child.set(str(key), str(value))
-                            for key, value in extra.items():
-                                child.set(key, str(value))
-                    else:
-                        if text:
-                            child.text = str(text)
-                        for key, value in attrib.items():
-                            child.set(str(key), str(value))
-                        for key, value in extra.items():
-                            child.set(key, str(value))
-
-        if self.auto_write is True:
-            self.write()
+        self._apply({"action": "update", "parent_tag": parent_tag, "elem_tag": elem_tag, "text": text, "attrib": dict(attrib, **extra), "parent_attrib": parent_attrib})
 
     def write(self, mode: str = "w", pretty_print: bool = True) -> None:
         """
@@ -888,9 +2219,30 @@ class BaseXMLWriter:
 
         :since: 0.1.0
         """
-        with open(self.fname, mode=mode) as file:
+        from os.path import getsize
+
+        if self.journal and "a" not in mode:
+            journal_records, self._journal_records = self._journal_records, []
+            try:
+                journal_size = getsize(self.fname + ".journal")
+            except FileNotFoundError:
+                journal_size = 0
+            if journal_size < self.journal_max_size:
+                if journal_records:
+                    _append_journal(self.fname, journal_records)
+                    document_cache.put(self.fname, _deepcopy(self._root))
+                return
+
+        with _open_write(self.fname, mode) as file:
             if pretty_print is False:
                 file.write(_ET.tostring(self._root, "utf-8").decode("ascii"))
+            elif _can_write_pretty(self._root):
+                _write_pretty(self._root, file.write)
             else:
                 file.write(self._prettify())
-            file.close()
+        _remove_journal(self.fname)
+
+        if "a" in mode:
+            document_cache.invalidate(self.fname)
+        else:
+            document_cache.put(self.fname, _deepcopy(self._root))
@@ -1,3 +1,5 @@
 #!/usr/bin/python3
 
 aion_not_installed_error = False
+
+xml_fsync_policy = "file"
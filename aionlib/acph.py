@@ -1,7 +1,600 @@
 #!/usr/bin/python3
 
+from . import aion_data_path as _aion_data_path
+from .config import add_language_change_callback as _add_language_change_callback
+from re import compile as _compile
+from threading import Event as _Event, Lock as _Lock, Thread as _Thread
 
-def add_acph(fname: str, skill: str, acph_dict: dict = {}) -> None:
+_word = _compile(r"\w+")
+
+acph_path = _aion_data_path + "/language"
+
+_indexes = {}
+_indexes_lock = _Lock()
+_matchers = {}
+
+
+def _bounded_distance(word: str, other: str, max_distance: int) -> int:
+    """
+    calculates the edit distance (levenshtein distance, where swapping two neighbouring letters counts as one edit) between two words,
+    but stops as soon as it exceeds 'max_distance'
+
+    :param word: str
+        first word
+        syntax: <word>
+        example: "strat"
+    :param other: str
+        second word
+        syntax: <word>
+        example: "start"
+    :param max_distance: int
+        maximal distance which is of interest
+        syntax: <distance>
+        example: 1
+    :return: int
+        returns the distance or 'max_distance' + 1 if the distance is greater than 'max_distance'
+        syntax: <distance>
+        example: 2
+
+    :since: 0.2.0
+    """
+    if abs(len(word) - len(other)) > max_distance:
+        return max_distance + 1
+    before_previous = None
+    previous = list(range(len(other) + 1))
+    for row, char in enumerate(word, 1):
+        current = [row]
+        for column, other_char in enumerate(other, 1):
+            distance = min(previous[column] + 1, current[column - 1] + 1, previous[column - 1] + (char != other_char))
+            if row > 1 and column > 1 and char == other[column - 2] and word[row - 2] == other_char:
+                distance = min(distance, before_previous[column - 2] + 1)
+            current.append(distance)
+        if min(current) > max_distance and min(previous) > max_distance:
+            return max_distance + 1
+        before_previous = previous
+        previous = current
+    return min(previous[-1], max_distance + 1)
+
+
+def _read_acph(fname: str) -> list:
+    """
+    reads all activate phrases of an '.acph' file
+
+    :param fname: str
+        file name of the '.acph' file
+        syntax: <file name>
+        example: "/etc/aion_data/language/en_US.acph"
+    :return: list
+        returns the activate phrases and their attributes in the order they are in the file
+        syntax: [(<activate phrase>, {<attributes>})]
+        example: [("start_test", {"skill": "test_skill", "method": "MyTestMethod"})]
+
+    :since: 0.2.0
+    """
+    from ._utils import BaseXMLReader
+
+    reader = BaseXMLReader(fname)
+    root = reader.get_infos(["<root>"]).values().index(0)[0]
+    acph_infos = reader.get_infos(root["childs"])
+    acphs = []
+    for acph in dict.fromkeys(root["childs"]):
+        for info in acph_infos[acph]:
+            if info["parent"]["tag"] == root["tag"]:
+                acphs.append((acph, info["attrib"]))
+    return acphs
+
+
+def _priority_attrib(priority: int) -> dict:
+    """
+    returns the attribute of an activate phrase which stores the priority of its skill
+
+    :param priority: int
+        priority of the skill
+        syntax: <priority>
+        example: 1
+    :return: dict
+        returns the attribute or an empty dict if the priority is None
+        syntax: {"priority": <priority>}
+        example: {"priority": "1"}
+
+    :raises ValueError: if the priority isn't an integer
+
+    :since: 0.2.0
+    """
+    if priority is None:
+        return {}
+    try:
+        return {"priority": str(int(priority))}
+    except ValueError:
+        raise ValueError("the priority must be an integer, got " + str(priority))
+
+
+def _trigrams(word: str) -> set:
+    word = "$" + word + "$"
+    return {word[i:i + 3] for i in range(len(word) - 2)}
+
+
+class AcphMatcher:
+    """
+    compiled matcher for activate phrases.
+    all terms of all activate phrases (the parts between '__and__') are compiled into one word level Aho-Corasick automaton,
+    so all matching activate phrases of a speech input are found in one pass over its words, regardless of how many phrases are installed
+
+    :since: 0.2.0
+    """
+
+    def __init__(self, fnames: list = [], fuzzy_threshold: float = 0.25) -> None:
+        """
+        :param fnames: list, optional
+            '.acph' files from which the activate phrases are loaded
+            syntax: [<file name>]
+            example: ["/etc/aion_data/language/en_US.acph"]
+        :param fuzzy_threshold: float, optional
+            maximal edit distance of a misspelled word in fuzzy mode, relative to the length of the word
+            syntax: <threshold>
+            example: 0.25
+            NOTE: with a threshold of 0.25 one error is tolerated in words with 4 to 7 letters, two in words with 8 to 11 letters and so on
+        :return: None
+
+        :since: 0.2.0
+        """
+        if not 0 <= fuzzy_threshold < 1:
+            raise ValueError("argument 'fuzzy_threshold' must be between 0 and 1, got " + str(fuzzy_threshold))
+
+        self.fuzzy_threshold = fuzzy_threshold
+        #: activate phrases of the added files which were skipped because they are invalid, syntax: [(<activate phrase>, <skill name>, <error message>)]
+        self.skipped = []
+
+        self._phrases = []
+        self._automaton = None
+        self._fuzzy_index = None
+
+        for fname in fnames:
+            self.add_file(fname)
+
+    def add(self, activate_phrase: str, skill: str, method: str, **extra: str) -> None:
+        """
+        adds an activate phrase to the matcher
+
+        :param activate_phrase: str
+            the activate phrase
+            syntax: <activate phrase>
+            example: "start__and__test"
+            NOTE: the '__and__' statement checks if the words before and after '__and__' are in the speech input
+        :param skill: str
+            skill name to which the activate phrase belongs
+            syntax: <skill name>
+            example: "test_skill"
+        :param method: str
+            method that should get called after the activate phrase was said
+            syntax: <method name>
+            example: "MyTestMethod"
+        :param extra: kwargs, optional
+            additional attributes of the activate phrase
+            syntax: <key>=<value>
+            example: priority="1"
+            NOTE: the 'priority' attribute must be an integer and is used by 'resolve' to rank matching activate phrases
+        :return: None
+
+        :raises ValueError: if the priority isn't an integer or the activate phrase doesn't contain any word
+
+        :since: 0.2.0
+        """
+        try:
+            int(extra.get("priority", 0))
+        except ValueError:
+            raise ValueError("the priority of the activate phrase " + activate_phrase + " must be an integer, got " + str(extra["priority"]))
+
+        terms = []
+        for term in activate_phrase.split("__and__"):
+            words = tuple(_word.findall(term.replace("_", " ").lower()))
+            if words and words not in terms:
+                terms.append(words)
+        if not terms:
+            raise ValueError("the activate phrase " + activate_phrase + " doesn't contain any word")
+        self._phrases.append((activate_phrase, skill, method, extra, terms))
+        self._automaton = None
+        self._fuzzy_index = None
+
+    def add_file(self, fname: str) -> None:
+        """
+        adds all activate phrases of an '.acph' file to the matcher.
+        invalid activate phrases (see 'add') are skipped and recorded in 'skipped', so one broken skill doesn't break the matching of all the others
+
+        :param fname: str
+            file name of the '.acph' file
+            syntax: <file name>
+            example: "/etc/aion_data/language/en_US.acph"
+        :return: None
+
+        :since: 0.2.0
+        """
+        for acph, attrib in _read_acph(fname):
+            attrib = dict(attrib)
+            skill = attrib.pop("skill", "")
+            method = attrib.pop("method", "")
+            try:
+                self.add(acph, skill, method, **attrib)
+            except ValueError as error:
+                self.skipped.append((acph, skill, str(error)))
+
+    def _build(self) -> tuple:
+        """
+        compiles the automaton of all added activate phrases
+
+        :return: tuple
+            returns the compiled automaton
+            syntax: (<goto tables>, <fail links>, <outputs>, <term targets>, <full masks>, <rank keys>)
+
+        :since: 0.2.0
+        """
+        goto = [{}]
+        outputs = [[]]
+        term_ids = {}
+        term_targets = []
+        full_masks = []
+        rank_keys = []
+
+        for number, (_, _, _, extra, terms) in enumerate(self._phrases):
+            full_masks.append((1 << len(terms)) - 1)
+            # lower keys rank first: more matched words, more terms, higher priority and finally the earlier added phrase
+            rank_keys.append((-sum(len(term) for term in terms), -len(terms), -int(extra.get("priority", 0)), number))
+            for bit, term in enumerate(terms):
+                if term not in term_ids:
+                    state = 0
+                    for word in term:
+                        if word not in goto[state]:
+                            goto[state][word] = len(goto)
+                            goto.append({})
+                            outputs.append([])
+                        state = goto[state][word]
+                    term_ids[term] = len(term_targets)
+                    term_targets.append([])
+                    outputs[state].append(term_ids[term])
+                term_targets[term_ids[term]].append((number, 1 << bit))
+
+        # breadth first, so the fail link of a state is always resolved before its children
+        fail = [0] * len(goto)
+        queue = list(goto[0].values())
+        for state in queue:
+            for word, child in goto[state].items():
+                fallback = fail[state]
+                while fallback and word not in goto[fallback]:
+                    fallback = fail[fallback]
+                fail[child] = goto[fallback].get(word, 0)
+                outputs[child] = outputs[child] + outputs[fail[child]]
+                queue.append(child)
+
+        return goto, fail, [tuple(output) for output in outputs], [tuple(targets) for targets in term_targets], full_masks, rank_keys
+
+    def _correct(self, words: list) -> list:
+        """
+        replaces every unknown word with the most similar word of the activate phrases (if one is similar enough).
+        candidates are looked up in a character trigram index and verified with a bounded edit distance
+
+        :param words: list
+            words of the speech input
+            syntax: [<word>]
+            example: ["strat", "the", "test"]
+        :return: list
+            returns the corrected words
+            syntax: [<word>]
+            example: ["start", "the", "test"]
+
+        :since: 0.2.0
+        """
+        if self._fuzzy_index is None:
+            vocabulary = []
+            for phrase in self._phrases:
+                for term in phrase[4]:
+                    vocabulary.extend(term)
+            vocabulary = list(dict.fromkeys(vocabulary))
+            trigrams = {}
+            for number, word in enumerate(vocabulary):
+                for trigram in _trigrams(word):
+                    trigrams.setdefault(trigram, []).append(number)
+            self._fuzzy_index = (vocabulary, set(vocabulary), trigrams, {})
+        vocabulary, known, trigrams, corrections = self._fuzzy_index
+
+        corrected = []
+        for word in words:
+            if word in known:
+                corrected.append(word)
+                continue
+            try:
+                corrected.append(corrections[word])
+                continue
+            except KeyError:
+                pass
+
+            max_distance = int(len(word) * self.fuzzy_threshold)
+            correction = word
+            if max_distance > 0:
+                # every edit destroys at most 4 trigrams of the word (a swap of two letters), so a similar word shares at least this many trigrams.
+                # very short words must share at least one trigram, otherwise nearly every word of the same length would be a candidate
+                word_trigrams = _trigrams(word)
+                min_shared = max(len(word_trigrams) - 4 * max_distance, 1)
+                shared = {}
+                for trigram in word_trigrams:
+                    for number in trigrams.get(trigram, ()):
+                        shared[number] = shared.get(number, 0) + 1
+                candidates = sorted(number for number, count in shared.items() if count >= min_shared and abs(len(vocabulary[number]) - len(word)) <= max_distance)
+
+                best = max_distance + 1
+                for number in candidates:
+                    distance = _bounded_distance(word, vocabulary[number], best - 1)
+                    if distance < best:
+                        best = distance
+                        correction = vocabulary[number]
+                        if best == 1:
+                            break
+            if len(corrections) >= 4096:
+                corrections.clear()
+            corrections[word] = correction
+            corrected.append(correction)
+        return corrected
+
+    def _matching(self, words: list) -> tuple:
+        """
+        finds the numbers of all activate phrases which are matching the words of a speech input
+
+        :param words: list
+            lowercase words of the speech input
+            syntax: [<word>]
+            example: ["start", "the", "test"]
+        :return: tuple
+            returns the numbers of the matching phrases and the compiled automaton
+            syntax: ([<phrase number>], <automaton>)
+
+        :since: 0.2.0
+        """
+        automaton = self._automaton
+        if automaton is None:
+            automaton = self._automaton = self._build()
+        goto, fail, outputs, term_targets, full_masks, _ = automaton
+
+        masks = {}
+        state = 0
+        for word in words:
+            while state and word not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(word, 0)
+            for term in outputs[state]:
+                for number, bit in term_targets[term]:
+                    masks[number] = masks.get(number, 0) | bit
+
+        return [number for number, mask in masks.items() if mask == full_masks[number]], automaton
+
+    def _infos(self, number: int) -> dict:
+        activate_phrase, skill, method, attrib, _ = self._phrases[number]
+        return {"activate_phrase": activate_phrase, "skill": skill, "method": method, "attrib": dict(attrib)}
+
+    def match(self, speech_input: str, fuzzy: bool = False) -> list:
+        """
+        finds all activate phrases which are matching the speech input
+
+        :param speech_input: str
+            complete spoken words
+            syntax: <speech input>
+            example: "Start the test"
+        :param fuzzy: bool, optional
+            sets if misspelled words should be corrected (see 'fuzzy_threshold') if no activate phrase matches exactly
+            syntax: <boolean>
+            example: True
+        :return: list
+            returns all matching activate phrases in the order they were added
+            syntax: [{"activate_phrase": <activate phrase>, "skill": <skill name>, "method": <method name>, "attrib": {<additional attributes>}}]
+            example: [{"activate_phrase": "start__and__test", "skill": "test_skill", "method": "MyTestMethod", "attrib": {}}]
+
+        :since: 0.2.0
+        """
+        return [self._infos(number) for number in sorted(self._candidates(speech_input, fuzzy)[0])]
+
+    def _candidates(self, speech_input: str, fuzzy: bool) -> tuple:
+        words = _word.findall(speech_input.lower())
+        numbers, automaton = self._matching(words)
+        if fuzzy and not numbers:
+            corrected = self._correct(words)
+            if corrected != words:
+                numbers, automaton = self._matching(corrected)
+        return numbers, automaton
+
+    def resolve(self, speech_input: str, fuzzy: bool = False) -> list:
+        """
+        finds all activate phrases which are matching the speech input, ranked from the best to the worst candidate.
+        candidates are ranked by the number of matched words, then by the number of '__and__' terms and then by their 'priority' attribute.
+        remaining ties are resolved by the order the activate phrases were added
+
+        :param speech_input: str
+            complete spoken words
+            syntax: <speech input>
+            example: "Start the test"
+        :param fuzzy: bool, optional
+            sets if misspelled words should be corrected (see 'fuzzy_threshold') if no activate phrase matches exactly
+            syntax: <boolean>
+            example: True
+        :return: list
+            returns all matching activate phrases, the best candidate first
+            syntax: [{"activate_phrase": <activate phrase>, "skill": <skill name>, "method": <method name>, "attrib": {<additional attributes>}, "score": (<matched words>, <terms>, <priority>)}]
+            example: [{"activate_phrase": "start__and__test", "skill": "test_skill", "method": "MyTestMethod", "attrib": {}, "score": (2, 2, 0)}]
+
+        :since: 0.2.0
+        """
+        numbers, automaton = self._candidates(speech_input, fuzzy)
+        rank_keys = automaton[5]
+
+        candidates = []
+        for number in sorted(numbers, key=rank_keys.__getitem__):
+            infos = self._infos(number)
+            infos["score"] = tuple(-key for key in rank_keys[number][:3])
+            candidates.append(infos)
+        return candidates
+
+
+class AcphIndex:
+    """
+    in memory index of the activate phrases of one language locale.
+    the '.acph' file is loaded once and then watched in a background thread, if it changes a new index is build and swapped in at once,
+    so lookups never touch the disk
+
+    :since: 0.2.0
+    """
+
+    def __init__(self, language_locale: str = None, poll_interval: float = 1.0, fuzzy_threshold: float = 0.25) -> None:
+        """
+        :param language_locale: str, optional
+            language locale of the activate phrases
+            syntax: <language locale>
+            example: "en_US"
+            NOTE: if not given, the language locale which is set in the aion config is used
+        :param poll_interval: float, optional
+            seconds between two checks if the '.acph' file has changed
+            syntax: <seconds>
+            example: 1.0
+            NOTE: if it's 0 or lower, the file isn't watched
+        :param fuzzy_threshold: float, optional
+            fuzzy threshold of the index (see 'AcphMatcher')
+            syntax: <threshold>
+            example: 0.25
+        :return: None
+
+        :since: 0.2.0
+        """
+        if language_locale is None:
+            from .config import Aion
+            language_locale = Aion().get_language()
+            if language_locale is None:
+                raise ValueError("argument 'language_locale' must be given if aion isn't installed")
+
+        self.language_locale = language_locale
+        self.fname = acph_path + "/" + language_locale + ".acph"
+        self.fuzzy_threshold = fuzzy_threshold
+        self.poll_interval = poll_interval
+
+        self._state = self._load()
+        self._stop = _Event()
+        if poll_interval > 0:
+            self._watcher = _Thread(target=self._watch, name="AcphIndex-" + language_locale, daemon=True)
+            self._watcher.start()
+        else:
+            self._watcher = None
+
+    def _load(self) -> tuple:
+        """
+        loads the '.acph' file
+
+        :return: tuple
+            returns the new state of the index
+            syntax: (<file signature>, <matcher>, <activate phrases>)
+
+        :since: 0.2.0
+        """
+        from os.path import abspath
+        from ._utils import _document_signature
+
+        signature = _document_signature(abspath(self.fname))
+        matcher = AcphMatcher([self.fname], self.fuzzy_threshold)
+        return signature, matcher, frozenset([phrase[0] for phrase in matcher._phrases] + [phrase[0] for phrase in matcher.skipped])
+
+    def _watch(self) -> None:
+        from os.path import abspath
+        from ._utils import _document_signature
+
+        fname = abspath(self.fname)
+        while not self._stop.wait(self.poll_interval):
+            try:
+                if _document_signature(fname) != self._state[0]:
+                    self._state = self._load()
+            except Exception:
+                # keep the old index until the file can be loaded again (it may be missing, invalid or not readable for a moment),
+                # the watcher must not die, otherwise the index would never be reloaded anymore
+                continue
+
+    def exist(self, acph: str) -> bool:
+        """
+        checks if an activate phrase exist
+
+        :param acph: str
+            activate phrase you want to check if exists
+            syntax: <acph name>
+            example: "start test"
+        :return: bool
+            returns True if acph exist / False if not
+            syntax: <boolean>
+            example: False
+
+        :since: 0.2.0
+        """
+        return acph.replace(" ", "_") in self._state[2]
+
+    def match(self, speech_input: str, fuzzy: bool = False) -> list:
+        """
+        finds all activate phrases which are matching the speech input (see 'AcphMatcher.match')
+
+        :param speech_input: str
+            complete spoken words
+            syntax: <speech input>
+            example: "Start the test"
+        :param fuzzy: bool, optional
+            sets if misspelled words should be corrected if no activate phrase matches exactly
+            syntax: <boolean>
+            example: True
+        :return: list
+            returns all matching activate phrases in the order they are in the file
+            syntax: [{"activate_phrase": <activate phrase>, "skill": <skill name>, "method": <method name>, "attrib": {<additional attributes>}}]
+            example: [{"activate_phrase": "start__and__test", "skill": "test_skill", "method": "MyTestMethod", "attrib": {}}]
+
+        :since: 0.2.0
+        """
+        return self._state[1].match(speech_input, fuzzy)
+
+    def resolve(self, speech_input: str, fuzzy: bool = False) -> list:
+        """
+        finds all activate phrases which are matching the speech input, ranked from the best to the worst candidate (see 'AcphMatcher.resolve')
+
+        :param speech_input: str
+            complete spoken words
+            syntax: <speech input>
+            example: "Start the test"
+        :param fuzzy: bool, optional
+            sets if misspelled words should be corrected if no activate phrase matches exactly
+            syntax: <boolean>
+            example: True
+        :return: list
+            returns all matching activate phrases, the best candidate first
+            syntax: [{"activate_phrase": <activate phrase>, "skill": <skill name>, "method": <method name>, "attrib": {<additional attributes>}, "score": (<matched words>, <terms>, <priority>)}]
+            example: [{"activate_phrase": "start__and__test", "skill": "test_skill", "method": "MyTestMethod", "attrib": {}, "score": (2, 2, 0)}]
+
+        :since: 0.2.0
+        """
+        return self._state[1].resolve(speech_input, fuzzy)
+
+    @property
+    def skipped(self) -> list:
+        """
+        invalid activate phrases of the '.acph' file, which aren't matched (see 'AcphMatcher.add_file')
+
+        :return: list
+            returns the skipped activate phrases
+            syntax: [(<activate phrase>, <skill name>, <error message>)]
+            example: [("__and__", "test_skill", "the activate phrase __and__ doesn't contain any word")]
+
+        :since: 0.2.0
+        """
+        return self._state[1].skipped
+
+    def stop(self) -> None:
+        """
+        stops watching the '.acph' file
+
+        :return: None
+
+        :since: 0.2.0
+        """
+        self._stop.set()
+
+
+def add_acph(fname: str, skill: str, acph_dict: dict = {}, priority: int = None) -> None:
     """
     adds an new entry(s) to from argument 'language_locale' given language
 
@@ -18,23 +611,145 @@ def add_acph(fname: str, skill: str, acph_dict: dict = {}) -> None:
         syntax: {<activate phrase>: <method that should get called after the activate phrase was said>}
         example: {"start test": "MyTestMethod"}
         NOTE: in key 'activate_phrase' you can use the '__and__' statement. This checks if the words before and after '__and__' are in the sentence that the user has spoken in
+    :param priority: int, optional
+        priority of the skill, if multiple activate phrases are matching a speech input the phrases with the higher priority are ranked first (see 'AcphMatcher.resolve')
+        syntax: <priority>
+        example: 1
 
     :since: 0.1.0
     """
-    try:
-        from .utils import BaseXMLWriter
-    except ImportError:
-        from utils import BaseXMLWriter
+    result = bulk_add_acph(fname, skill, acph_dict, strict=True, priority=priority)
+    if result["skipped"] or result["conflicted"]:
+        raise IndexError("the activate phrase " + (result["skipped"] + result["conflicted"])[0] + " already exist")
 
-    acph_writer = BaseXMLWriter(fname)
-    for acph, method in acph_dict:
-        if exist_acph(fname, acph):
-            raise IndexError("the activate phrase " + acph + " already exist")
-        acph_writer.add("<root>", acph, skill=skill, method=method)
-    acph_writer.write()
 
+def bulk_add_acph(fname: str, skill: str, acph_dict: dict = {}, strict: bool = False, priority: int = None) -> dict:
+    """
+    adds many activate phrases at once, the file is read and written only one time
 
-def create_acph_file(language_locale: str, skill_acph_dict_dict: dict = {}) -> None:
+    :param fname: str
+        name of the file where the activate phrases should be added
+        syntax: <file name>
+        example: "/home/pi/test.acph"
+    :param skill: str
+        skill name to which the activate phrases belong
+        syntax: "<skill name>"
+        example: "test_skill"
+    :param acph_dict: dict, optional
+        defines a word or a sentence from which a method is called
+        syntax: {<activate phrase>: <method that should get called after the activate phrase was said>}
+        example: {"start test": "MyTestMethod"}
+        NOTE: in key 'activate_phrase' you can use the '__and__' statement. This checks if the words before and after '__and__' are in the sentence that the user has spoken in
+    :param strict: bool, optional
+        sets if nothing should be added if any activate phrase already exist or is conflicted
+        syntax: <boolean>
+        example: False
+    :param priority: int, optional
+        priority of the skill, if multiple activate phrases are matching a speech input the phrases with the higher priority are ranked first (see 'AcphMatcher.resolve')
+        syntax: <priority>
+        example: 1
+    :return: dict
+        returns which activate phrases were added, which were skipped because they already exist for the same skill and method
+        and which were not added because they already exist for an other skill or method
+        syntax: {"added": [<activate phrase>], "skipped": [<activate phrase>], "conflicted": [<activate phrase>]}
+        example: {"added": ["start_test"], "skipped": [], "conflicted": ["stop_test"]}
+
+    :since: 0.2.0
+    """
+    from ._utils import BaseXMLWriter
+
+    extra = _priority_attrib(priority)
+
+    existing = {}
+    for acph, attrib in _read_acph(fname):
+        existing.setdefault(acph, (attrib.get("skill"), attrib.get("method")))
+
+    result = {"added": [], "skipped": [], "conflicted": []}
+    new_acphs = {}
+    for acph, method in acph_dict.items():
+        acph = str(acph).replace(" ", "_")
+        if acph in existing:
+            if existing[acph] == (skill, method):
+                result["skipped"].append(acph)
+            else:
+                result["conflicted"].append(acph)
+        else:
+            existing[acph] = (skill, method)
+            new_acphs[acph] = method
+            result["added"].append(acph)
+
+    if strict and (result["skipped"] or result["conflicted"]):
+        result["added"] = []
+    elif new_acphs:
+        acph_writer = BaseXMLWriter(fname)
+        with acph_writer.batch():
+            for acph, method in new_acphs.items():
+                acph_writer.add("<root>", acph, skill=skill, method=method, **extra)
+    return result
+
+
+def bulk_delete_acph(fname: str, acph_list: list = []) -> dict:
+    """
+    deletes many activate phrases at once, the file is read and written only one time
+
+    :param fname: str
+        file from which the activate phases are being deleted
+        syntax: <file name>
+        example: "/home/pi/test.acph"
+    :param acph_list: list, optional
+        name of the activate phases you want to remove
+        syntax: [<activate phase name>]
+        example: ["start test"]
+    :return: dict
+        returns which activate phrases were deleted and which were skipped because they don't exist
+        syntax: {"deleted": [<activate phrase>], "skipped": [<activate phrase>]}
+        example: {"deleted": ["start_test"], "skipped": []}
+
+    :since: 0.2.0
+    """
+    from ._utils import BaseXMLWriter
+
+    existing = set(acph for acph, _ in _read_acph(fname))
+
+    result = {"deleted": [], "skipped": []}
+    for acph in dict.fromkeys(str(acph).replace(" ", "_") for acph in acph_list):
+        if acph in existing:
+            result["deleted"].append(acph)
+        else:
+            result["skipped"].append(acph)
+
+    if result["deleted"]:
+        acph_writer = BaseXMLWriter(fname)
+        with acph_writer.batch():
+            for acph in result["deleted"]:
+                acph_writer.remove("<root>", acph)
+    return result
+
+
+def bulk_exist_acph(fname: str, acph_list: list = []) -> dict:
+    """
+    checks if many activate phrases exist, the file is read only one time
+
+    :param fname: str
+        file from which the activate phrases should be search
+        syntax: <file name>
+        example: "/home/pi/test.acph"
+    :param acph_list: list, optional
+        activate phrases you want to check if they exist
+        syntax: [<acph name>]
+        example: ["start test"]
+    :return: dict
+        returns for every activate phrase if it exist
+        syntax: {<activate phrase>: <boolean>}
+        example: {"start test": True}
+
+    :since: 0.2.0
+    """
+    existing = set(acph for acph, _ in _read_acph(fname))
+    return {acph: str(acph).replace(" ", "_") in existing for acph in acph_list}
+
+
+def create_acph_file(language_locale: str, skill_acph_dict_dict: dict = {}, skill_priority_dict: dict = {}) -> None:
     """
     creates a new '.acph' file for given language locale with given skill_acph_dict_dict
 
@@ -47,19 +762,21 @@ def create_acph_file(language_locale: str, skill_acph_dict_dict: dict = {}) -> N
         syntax: {<skill name>: {<activate phrase>: <method that should get called after the activate phrase was said>}}
         example: {"test_skill": {"start test": "MyTestMethod"}}
         NOTE: in key 'activate_phrase' you can use the '__and__' statement. This checks if the words before and after '__and__' are in the sentence that the user has spoken in
+    :param skill_priority_dict: dict, optional
+        priorities of the skills, if multiple activate phrases are matching a speech input the phrases with the higher priority are ranked first (see 'AcphMatcher.resolve')
+        syntax: {<skill name>: <priority>}
+        example: {"test_skill": 1}
     :return: None
 
     :since: 0.1.0
     """
-    try:
-        from .utils import BaseXMLBuilder
-    except ImportError:
-        from utils import BaseXMLBuilder
+    from ._utils import BaseXMLBuilder
 
     acph_builder = BaseXMLBuilder(language_locale)
     for skill, acph_dict in skill_acph_dict_dict.items():
+        extra = _priority_attrib(skill_priority_dict.get(skill))
         for acph, method in acph_dict.items():
-            acph_builder.create_root_element(acph, skill=skill, method=method)
+            acph_builder.create_root_element(acph, skill=skill, method=method, **extra)
 
     acph_builder.write(language_locale + ".acph")
 
@@ -80,15 +797,7 @@ def delete_acph(fname: str, acph_list: list = []) -> None:
 
     :since: 0.1.0
     """
-    try:
-        from .utils import BaseXMLWriter
-    except ImportError:
-        from utils import BaseXMLWriter
-
-    acph_writer = BaseXMLWriter(fname)
-    for item in acph_list:
-        acph_writer.remove("<root>", str(item))
-    acph_writer.write()
+    bulk_delete_acph(fname, acph_list)
 
 
 def exist_acph(fname: str, acph: str) -> bool:
@@ -110,16 +819,114 @@ def exist_acph(fname: str, acph: str) -> bool:
 
     :since: 0.1.0
     """
-    try:
-        from .utils import BaseXMLReader
-    except ImportError:
-        from utils import BaseXMLReader
+    from ._utils import BaseXMLStreamReader
 
     acph = acph.replace(" ", "_")
 
-    acph_reader = BaseXMLReader(fname)
-    for item in acph_reader.get_infos(["<root>"]).items().index(0):
-        if acph in item["childs"]:
-            return True
-        else:
-            return False
+    return BaseXMLStreamReader(fname).exist_child("<root>", acph)
+
+
+def resolve_acph(fname: str, speech_input: str, fuzzy: bool = False) -> list:
+    """
+    returns the activate phrases of a file which are matching the speech input, ranked from the best to the worst candidate (see 'AcphMatcher.resolve')
+
+    :param fname: str
+        file from which the activate phrases should be resolved
+        syntax: <file name>
+        example: "/etc/aion_data/language/en_US.acph"
+    :param speech_input: str
+        complete spoken words
+        syntax: <speech input>
+        example: "Start the test"
+    :param fuzzy: bool, optional
+        sets if misspelled words should be corrected if no activate phrase matches exactly (see 'AcphMatcher.resolve')
+        syntax: <boolean>
+        example: True
+    :return: list
+        returns all matching activate phrases, the best candidate first
+        syntax: [{"activate_phrase": <activate phrase>, "skill": <skill name>, "method": <method name>, "attrib": {<additional attributes>}, "score": (<matched words>, <terms>, <priority>)}]
+        example: [{"activate_phrase": "start__and__test", "skill": "test_skill", "method": "MyTestMethod", "attrib": {}, "score": (2, 2, 0)}]
+
+    :since: 0.2.0
+    """
+    from os.path import abspath
+    from ._utils import document_cache
+
+    fname = abspath(fname)
+    # the cached document is only replaced if the file changes, so the matcher is rebuild only after a change
+    document = document_cache.get(fname)
+    try:
+        matcher_document, matcher = _matchers[fname]
+    except KeyError:
+        matcher_document = matcher = None
+    if matcher_document is not document:
+        matcher = AcphMatcher([fname])
+        _matchers[fname] = (document, matcher)
+    return matcher.resolve(speech_input, fuzzy)
+
+
+def get_acph_index(language_locale: str = None) -> AcphIndex:
+    """
+    returns the shared activate phrase index of a language locale, the index is created at the first call
+
+    :param language_locale: str, optional
+        language locale of the activate phrases
+        syntax: <language locale>
+        example: "en_US"
+        NOTE: if not given, the language locale which is set in the aion config is used
+    :return: AcphIndex
+        returns the index of the language locale
+
+    :since: 0.2.0
+    """
+    if language_locale is None:
+        from .config import Aion
+        language_locale = Aion().get_language()
+        if language_locale is None:
+            raise ValueError("argument 'language_locale' must be given if aion isn't installed")
+
+    with _indexes_lock:
+        index = _indexes.get(language_locale)
+    if index is not None:
+        return index
+
+    # the file is parsed outside the lock, so lookups of other locales aren't blocked by it
+    new_index = AcphIndex(language_locale)
+    with _indexes_lock:
+        index = _indexes.setdefault(language_locale, new_index)
+    if index is not new_index:
+        # an other thread was faster
+        new_index.stop()
+    return index
+
+
+def _prebuild_acph_index(language_locale: str) -> None:
+    """
+    builds the shared index of a language locale in the background (gets called if the language is changed with 'config.Aion.set_language').
+    the shared indexes of all other locales are dropped and their watchers are stopped once the new index is ready
+
+    :param language_locale: str
+        language locale of the activate phrases
+        syntax: <language locale>
+        example: "de_DE"
+    :return: None
+
+    :since: 0.2.0
+    """
+    from os.path import isfile
+
+    def prebuild():
+        try:
+            get_acph_index(language_locale)
+        except (FileNotFoundError, ValueError):
+            return
+        with _indexes_lock:
+            superseded = [_indexes.pop(locale) for locale in list(_indexes) if locale != language_locale]
+        for index in superseded:
+            index.stop()
+
+    if isfile(acph_path + "/" + language_locale + ".acph"):
+        _Thread(target=prebuild, name="AcphIndex-prebuild-" + language_locale, daemon=True).start()
+
+
+_add_language_change_callback(_prebuild_acph_index)
@@ -7,6 +7,8 @@ if is_aion:
     from ._utils import import_aion_internal_file as _import_aion_internal_files
     _config = _import_aion_internal_files("config")
 
+_language_change_callbacks = []
+
 
 class Aion:
 
@@ -165,6 +167,8 @@ class Aion:
         """
         if is_aion:
             self._aion_config.set_language(language)
+            for callback in list(_language_change_callbacks):
+                callback(language)
         else:
             no_aion()
 
@@ -288,6 +292,22 @@ def add_entry(name: str, text: str = None, attrib: dict = {}, parent_name: str =
         no_aion()
 
 
+def add_language_change_callback(callback) -> None:
+    """
+    adds a function which gets called after the language locale was changed with 'Aion.set_language'
+
+    :param callback: function
+        function which gets called with the new language locale as argument
+        syntax: <function>
+        example: print
+    :return: None
+
+    :since: 0.2.0
+    """
+    if callback not in _language_change_callbacks:
+        _language_change_callbacks.append(callback)
+
+
 def delete_entry(name: str, parent_name: str = "config", parent_attrib: dict = {}) -> None:
     """
     deletes an entry from the config file
@@ -343,6 +363,22 @@ def get_entry(name: str, parent_name: str = None, parent_attrib: dict = {}) -> N
         no_aion()
 
 
+def remove_language_change_callback(callback) -> None:
+    """
+    removes a function which was added with 'add_language_change_callback'
+
+    :param callback: function
+        function which should be removed
+        syntax: <function>
+        example: print
+    :return: None
+
+    :since: 0.2.0
+    """
+    if callback in _language_change_callbacks:
+        _language_change_callbacks.remove(callback)
+
+
 def update_entry(name: str, text: str = None, attrib: dict = {}, parent_name: str = "config", **extra: str) -> None:
     """
     updates an entry
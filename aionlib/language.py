@@ -1,7 +1,487 @@
 #!/usr/bin/python3
 
-from . import is_aion
+from . import aion_data_path as _aion_data_path, is_aion
 from ._utils import no_aion
+from .config import add_language_change_callback as _add_language_change_callback
+from threading import Lock as _Lock
+from struct import Struct as _Struct
+from time import monotonic as _monotonic
+
+config_file = _aion_data_path + "/config.xml"
+language_path = _aion_data_path + "/language"
+
+#: language locale which is used if an entry doesn't exist in any other locale of a fallback chain
+default_locale = "en_US"
+
+_compiled_magic = b"AIONLNG1"
+# magic, number of entries, mtime in nanoseconds, size and inode of the source file
+_compiled_header = _Struct("<8sIqqQ")
+# offset and length of the key, offset and length of the text
+_compiled_record = _Struct("<IIII")
+
+_catalogs = {}
+_catalogs_lock = _Lock()
+# time of the last check, signature of the config file and the language locale which is set in it
+_current_locale = (None, None, None)
+_fallback_chains = {}
+_resolutions = {}
+
+
+class MessageCatalog:
+    """
+    all entries of a '.lng' file, loaded once into a dict, so that getting an entry is only a dict lookup
+
+    :since: 0.2.0
+    """
+
+    def __init__(self, fname: str) -> None:
+        """
+        :param fname: str
+            file name of the '.lng' file
+            syntax: <file name>
+            example: "/etc/aion_data/language/en_US.lng"
+        :return: None
+
+        :since: 0.2.0
+        """
+        self.fname = fname
+
+        self._entries = _read_entries(fname)
+
+    def __contains__(self, entry: str) -> bool:
+        return entry in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, package: str, entry: str, format: dict = {}) -> str:
+        """
+        returns the (formatted) text of an entry
+
+        :param package: str
+            package (skill) name of the entry
+            syntax: <package name>
+            example: "test_skill"
+        :param entry: str
+            name of the entry
+            syntax: <entry name>
+            example: "test_entry"
+        :param format: dict, optional
+            substrings of the text which should be replaced, like in 'start'
+            syntax: {<substring>: <replacement>}
+            example: {"test": "newtest"}
+        :return: str
+            returns the formatted text
+            syntax: <text>
+            example: "This is a newtest"
+
+        :since: 0.2.0
+        """
+        try:
+            text = self._entries[package + "." + entry.replace(" ", "_")]
+        except KeyError:
+            raise KeyError("the entry " + package + "." + entry + " doesn't exist in " + self.fname)
+        return _format_text(text, format)
+
+
+class CompiledCatalog:
+    """
+    read only catalog of a compiled '.lng' file (see 'compile').
+    the compiled file is mapped into memory and entries are found by binary search, so nothing has to be parsed
+    and all processes which are using the same file share one copy of it in the page cache
+
+    :since: 0.2.0
+    """
+
+    def __init__(self, fname: str) -> None:
+        """
+        :param fname: str
+            file name of the '.lng' file (not of the compiled file)
+            syntax: <file name>
+            example: "/etc/aion_data/language/en_US.lng"
+        :return: None
+
+        :raises FileNotFoundError: if the '.lng' file wasn't compiled
+        :raises ValueError: if the compiled file is invalid or the '.lng' file has changed since it was compiled
+
+        :since: 0.2.0
+        """
+        from mmap import mmap, ACCESS_READ
+        from ._utils import _file_signature
+
+        self.fname = fname
+
+        with open(fname + "c", "rb") as file:
+            try:
+                self._map = mmap(file.fileno(), 0, access=ACCESS_READ)
+            except ValueError:
+                raise ValueError("the compiled file " + fname + "c is empty")
+        if len(self._map) < _compiled_header.size:
+            self._map.close()
+            raise ValueError("the compiled file " + fname + "c is invalid")
+        magic, self._size, mtime_ns, size, inode = _compiled_header.unpack_from(self._map)
+        if magic != _compiled_magic:
+            self._map.close()
+            raise ValueError("the compiled file " + fname + "c is invalid")
+        if _file_signature(fname) != (mtime_ns, size, inode):
+            self._map.close()
+            raise ValueError("the file " + fname + " has changed since it was compiled")
+
+    def __contains__(self, entry: str) -> bool:
+        return self._find(entry) is not None
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _find(self, entry: str) -> str:
+        """
+        searches an entry
+
+        :param entry: str
+            full name of the entry
+            syntax: <package name>.<entry name>
+            example: "test_skill.test_entry"
+        :return: str
+            returns the text of the entry or None if it doesn't exist
+
+        :since: 0.2.0
+        """
+        key = entry.encode("utf-8")
+        data = self._map
+        low = 0
+        high = self._size
+        while low < high:
+            middle = (low + high) // 2
+            key_offset, key_length, text_offset, text_length = _compiled_record.unpack_from(data, _compiled_header.size + middle * _compiled_record.size)
+            middle_key = data[key_offset:key_offset + key_length]
+            if middle_key < key:
+                low = middle + 1
+            elif middle_key > key:
+                high = middle
+            else:
+                return data[text_offset:text_offset + text_length].decode("utf-8")
+        return None
+
+    def close(self) -> None:
+        """
+        unmaps the compiled file
+
+        :return: None
+
+        :since: 0.2.0
+        """
+        self._map.close()
+
+    def get(self, package: str, entry: str, format: dict = {}) -> str:
+        """
+        returns the (formatted) text of an entry
+
+        :param package: str
+            package (skill) name of the entry
+            syntax: <package name>
+            example: "test_skill"
+        :param entry: str
+            name of the entry
+            syntax: <entry name>
+            example: "test_entry"
+        :param format: dict, optional
+            substrings of the text which should be replaced, like in 'start'
+            syntax: {<substring>: <replacement>}
+            example: {"test": "newtest"}
+        :return: str
+            returns the formatted text
+            syntax: <text>
+            example: "This is a newtest"
+
+        :since: 0.2.0
+        """
+        text = self._find(package + "." + entry.replace(" ", "_"))
+        if text is None:
+            raise KeyError("the entry " + package + "." + entry + " doesn't exist in " + self.fname)
+        return _format_text(text, format)
+
+
+def _format_text(text: str, format: dict) -> str:
+    """
+    formats a text the same way the aion core does, every key of 'format' which is in the text is replaced by its value
+
+    :param text: str
+        the text
+        syntax: <text>
+        example: "This is a test"
+    :param format: dict
+        substrings of the text which should be replaced
+        syntax: {<substring>: <replacement>}
+        example: {"test": "newtest"}
+    :return: str
+        returns the formatted text
+        syntax: <text>
+        example: "This is a newtest"
+
+    :since: 0.2.0
+    """
+    for old, new in format.items():
+        text = text.replace(str(old), str(new))
+    return text
+
+
+def _read_entries(fname: str) -> dict:
+    """
+    reads all entries of a '.lng' file
+
+    :param fname: str
+        file name of the '.lng' file
+        syntax: <file name>
+        example: "/etc/aion_data/language/en_US.lng"
+    :return: dict
+        returns the texts of all entries, if an entry exist multiple times the first one is used
+        syntax: {<package name>.<entry name>: <text>}
+        example: {"test_skill.test_entry": "The test was successful"}
+
+    :since: 0.2.0
+    """
+    from os.path import abspath
+    from ._utils import document_cache
+
+    entries = {}
+    for element in document_cache.get(abspath(fname)).root:
+        if element.tag not in entries:
+            entries[element.tag] = element.text or ""
+    return entries
+
+
+def _get_current_locale(check_interval: float = 1.0) -> str:
+    """
+    returns the language locale which is set in the aion config.
+    the locale is cached and only read again if the config file has changed (checked at most every 'check_interval' seconds),
+    so a language change of the aion core (or of an other process) is noticed too
+
+    :param check_interval: float, optional
+        minimal seconds between two checks if the config file has changed
+        syntax: <seconds>
+        example: 1.0
+    :return: str
+        returns the language locale or None if aion isn't installed
+        syntax: <language locale>
+        example: "en_US"
+
+    :since: 0.2.0
+    """
+    global _current_locale
+
+    checked, signature, language_locale = _current_locale
+    now = _monotonic()
+    if checked is not None and now - checked < check_interval:
+        return language_locale
+
+    from ._utils import _file_signature
+
+    current_signature = _file_signature(config_file)
+    if checked is None or current_signature != signature:
+        from .config import Aion
+        language_locale = Aion().get_language()
+    _current_locale = (now, current_signature, language_locale)
+    return language_locale
+
+
+def _language_changed(language_locale: str) -> None:
+    global _current_locale
+
+    from ._utils import _file_signature
+
+    _current_locale = (_monotonic(), _file_signature(config_file), language_locale)
+    preload_locales([language_locale], background=True)
+
+
+def get_message_catalog(language_locale: str = None, check_interval: float = 1.0) -> MessageCatalog:
+    """
+    returns the shared message catalog of a language locale.
+    the catalog is loaded at the first call and reloaded if the '.lng' file has changed (checked at most every 'check_interval' seconds)
+
+    :param language_locale: str, optional
+        language locale of the catalog
+        syntax: <language locale>
+        example: "en_US"
+        NOTE: if not given, the language locale which is set in the aion config is used
+    :param check_interval: float, optional
+        minimal seconds between two checks if the '.lng' file has changed
+        syntax: <seconds>
+        example: 1.0
+    :return: MessageCatalog / CompiledCatalog
+        returns the catalog or None if the language locale has no '.lng' file
+        NOTE: if the '.lng' file was compiled (see 'compile') and hasn't changed since, the compiled catalog is used
+
+    :since: 0.2.0
+    """
+    if language_locale is None:
+        language_locale = _get_current_locale()
+        if language_locale is None:
+            return None
+
+    now = _monotonic()
+    try:
+        checked, signature, catalog = _catalogs[language_locale]
+        if now - checked < check_interval:
+            return catalog
+    except KeyError:
+        signature = catalog = None
+
+    from os.path import abspath
+    from ._utils import _document_signature
+
+    fname = abspath(language_path + "/" + language_locale + ".lng")
+    with _catalogs_lock:
+        current_signature = _document_signature(fname)
+        if current_signature != signature:
+            if current_signature[0] is None:
+                catalog = None
+            else:
+                catalog = None
+                if current_signature[1] is None:
+                    try:
+                        catalog = CompiledCatalog(fname)
+                    except (FileNotFoundError, ValueError):
+                        pass
+                if catalog is None:
+                    catalog = MessageCatalog(fname)
+            # an other catalog may now contain entries which were resolved to a fallback locale
+            _resolutions.clear()
+        _catalogs[language_locale] = (now, current_signature, catalog)
+    return catalog
+
+
+def get_fallback_chain(language_locale: str) -> tuple:
+    """
+    returns the fallback chain of a language locale, the locales in which an entry is searched in this order.
+    if no chain was set with 'set_fallback_chain', the chain is the locale itself, the supported locales of the same language and 'default_locale'
+
+    :param language_locale: str
+        language locale of the chain
+        syntax: <language locale>
+        example: "de_AT"
+    :return: tuple
+        returns the fallback chain
+        syntax: (<language locale>)
+        example: ("de_AT", "de_DE", "en_US")
+
+    :since: 0.2.0
+    """
+    try:
+        return _fallback_chains[language_locale]
+    except KeyError:
+        pass
+
+    from .config import Aion
+
+    language = language_locale.split("_")[0]
+    chain = [language_locale] + [locale for locale in Aion().supported_languages if locale.split("_")[0] == language] + [default_locale]
+    chain = tuple(dict.fromkeys(chain))
+    _fallback_chains[language_locale] = chain
+    return chain
+
+
+def preload_locales(language_locales: list = None, background: bool = False) -> None:
+    """
+    loads the message catalogs of language locales and their fallback chains into memory
+
+    :param language_locales: list, optional
+        the language locales
+        syntax: [<language locale>]
+        example: ["de_DE", "en_US"]
+        NOTE: if not given, all supported language locales (see 'config.Aion.supported_languages') are loaded
+    :param background: bool, optional
+        sets if the catalogs should be loaded in a background thread
+        syntax: <boolean>
+        example: False
+    :return: None
+
+    :since: 0.2.0
+    """
+    if language_locales is None:
+        from .config import Aion
+        language_locales = Aion().supported_languages
+
+    def preload():
+        for language_locale in dict.fromkeys(locale for language_locale in language_locales for locale in get_fallback_chain(language_locale)):
+            get_message_catalog(language_locale)
+
+    if background:
+        from threading import Thread
+        Thread(target=preload, name="aionlib-preload-locales", daemon=True).start()
+    else:
+        preload()
+
+
+def resolve_catalog(package: str, entry: str, language_locale: str = None) -> MessageCatalog:
+    """
+    returns the first catalog of the fallback chain (see 'get_fallback_chain') which contains an entry, the result is memoized
+
+    :param package: str
+        package (skill) name of the entry
+        syntax: <package name>
+        example: "test_skill"
+    :param entry: str
+        name of the entry
+        syntax: <entry name>
+        example: "test_entry"
+    :param language_locale: str, optional
+        language locale from which the search starts
+        syntax: <language locale>
+        example: "de_AT"
+        NOTE: if not given, the language locale which is set in the aion config is used
+    :return: MessageCatalog
+        returns the catalog or None if no locale of the chain contains the entry
+
+    :since: 0.2.0
+    """
+    if language_locale is None:
+        language_locale = _get_current_locale()
+        if language_locale is None:
+            return None
+
+    key = package + "." + entry.replace(" ", "_")
+    chain = get_fallback_chain(language_locale)
+    try:
+        resolved_locale = _resolutions[(language_locale, key)]
+    except KeyError:
+        pass
+    else:
+        # let the catalogs before the resolved one check for changes, a reload of one of them clears the memoized results
+        for locale in chain:
+            catalog = get_message_catalog(locale)
+            if locale == resolved_locale:
+                break
+        if (language_locale, key) in _resolutions:
+            return catalog if resolved_locale is not None else None
+
+    resolved_locale = None
+    for locale in chain:
+        catalog = get_message_catalog(locale)
+        if catalog is not None and key in catalog:
+            resolved_locale = locale
+            break
+    _resolutions[(language_locale, key)] = resolved_locale
+    return None if resolved_locale is None else catalog
+
+
+def set_fallback_chain(language_locale: str, fallback_locales: list) -> None:
+    """
+    sets the locales in which an entry is searched if it doesn't exist in a language locale
+
+    :param language_locale: str
+        the language locale
+        syntax: <language locale>
+        example: "de_AT"
+    :param fallback_locales: list
+        the fallback locales, in the order they are searched
+        syntax: [<language locale>]
+        example: ["de_DE", "en_US"]
+    :return: None
+
+    :since: 0.2.0
+    """
+    _fallback_chains[language_locale] = tuple(dict.fromkeys([language_locale] + list(fallback_locales)))
+    _resolutions.clear()
 
 
 def add_entry(fname: str, package, entry_dict: dict = {}) -> None:
@@ -30,14 +510,137 @@ def add_entry(fname: str, package, entry_dict: dict = {}) -> None:
     if isfile(fname) is False:
         raise FileNotFoundError("the file " + fname + " doesn't exist")
 
-    from ._utils import BaseXMLWriter
+    from ._utils import BaseXMLReader, BaseXMLWriter
+
+    existing_entries = set(BaseXMLReader(fname).get_infos(["<root>"]).values().index(0)[0]["childs"])
 
     lng_adder = BaseXMLWriter(fname)
-    for entry, text in entry_dict.items():
-        if exist_entry(fname, package, entry) is True:
-            raise IndexError("the entry " + entry + " already exist")
-        lng_adder.add("<root>", package + "." + str(entry), text=str(text))
-    lng_adder.write()
+    with lng_adder.batch():
+        for entry, text in entry_dict.items():
+            entry_name = str(package) + "." + str(entry).replace(" ", "_")
+            if entry_name in existing_entries:
+                raise IndexError("the entry " + str(entry) + " already exist")
+            lng_adder.add("<root>", entry_name, text=str(text))
+            existing_entries.add(entry_name)
+
+
+def bulk_add_entries(package: str, language_dict: dict, language_locales: list, overwrite: bool = False) -> dict:
+    """
+    adds the entries of a package to the '.lng' files of multiple language locales (e.g. the 'language_dict' of a 'skill.aion' or 'plugin.aion' file).
+    every file is read and written only one time, not existing files are created
+
+    :param package: str
+        package name to which the entries belong
+        syntax: <package name>
+        example: "test_skill"
+    :param language_dict: dict
+        texts of the entries
+        syntax: {<entry name>: <text of your entry>}
+        example: {"test_entry": "The test was successful"}
+        NOTE: to use different texts for the language locales, the text can also be a dict: {<entry name>: {<language locale>: <text>}}
+    :param language_locales: list
+        language locales to which the entries should be added
+        syntax: [<language locale>]
+        example: ["de_DE", "en_US"]
+    :param overwrite: bool, optional
+        sets if existing entries with an other text should be overwritten
+        syntax: <boolean>
+        example: False
+    :return: dict
+        returns for every language locale which entries were added, updated (overwritten), unchanged (already existing with the same text)
+        and conflicted (already existing with an other text and not overwritten)
+        syntax: {<language locale>: {"added": [<entry>], "updated": [<entry>], "unchanged": [<entry>], "conflicted": [<entry>]}}
+        example: {"en_US": {"added": ["test_skill.test_entry"], "updated": [], "unchanged": [], "conflicted": []}}
+
+    :since: 0.2.0
+    """
+    from os.path import isfile
+    from ._utils import BaseXMLBuilder, BaseXMLWriter
+
+    report = {}
+    for language_locale in language_locales:
+        texts = {}
+        for entry, text in language_dict.items():
+            if isinstance(text, dict):
+                if language_locale not in text:
+                    continue
+                text = text[language_locale]
+            texts[str(package) + "." + str(entry).replace(" ", "_")] = str(text)
+
+        fname = language_path + "/" + language_locale + ".lng"
+        result = report[language_locale] = {"added": [], "updated": [], "unchanged": [], "conflicted": []}
+        if not isfile(fname):
+            lng_file = BaseXMLBuilder(language_locale)
+            for entry, text in texts.items():
+                lng_file.create_root_element(entry, text=text)
+                result["added"].append(entry)
+            lng_file.write(fname)
+            continue
+
+        existing = _read_entries(fname)
+        for entry, text in texts.items():
+            if entry not in existing:
+                result["added"].append(entry)
+            elif existing[entry] == text:
+                result["unchanged"].append(entry)
+            elif overwrite:
+                result["updated"].append(entry)
+            else:
+                result["conflicted"].append(entry)
+
+        if result["added"] or result["updated"]:
+            lng_writer = BaseXMLWriter(fname)
+            with lng_writer.batch():
+                for entry in result["added"]:
+                    lng_writer.add("<root>", entry, text=texts[entry])
+                for entry in result["updated"]:
+                    lng_writer.update("<root>", entry, text=texts[entry])
+    return report
+
+
+def compile(fname: str) -> str:
+    """
+    compiles a '.lng' file into a binary lookup table ('<filename>c'), which is used instead of the file as long as the file isn't changed (see 'CompiledCatalog').
+    the table contains a sorted index of all entries with offsets into a blob of the utf-8 encoded entry names and texts
+
+    :param fname: str
+        file name of the '.lng' file
+        syntax: <file name>
+        example: "/etc/aion_data/language/en_US.lng"
+    :return: str
+        returns the file name of the compiled file
+        syntax: <file name>
+        example: "/etc/aion_data/language/en_US.lngc"
+
+    :since: 0.2.0
+    """
+    from os.path import abspath
+    from ._utils import _file_signature, _open_write, BaseXMLWriter
+
+    fname = abspath(fname)
+    if _file_signature(fname + ".journal") is not None:
+        # the table must match the file itself, so the journal is folded into the file first
+        BaseXMLWriter(fname).write()
+    signature = _file_signature(fname)
+    if signature is None:
+        raise FileNotFoundError("the file " + fname + " doesn't exist")
+
+    entries = sorted((entry.encode("utf-8"), text.encode("utf-8")) for entry, text in _read_entries(fname).items())
+
+    records = []
+    blob = []
+    offset = _compiled_header.size + len(entries) * _compiled_record.size
+    for key, text in entries:
+        records.append(_compiled_record.pack(offset, len(key), offset + len(key), len(text)))
+        blob.append(key)
+        blob.append(text)
+        offset += len(key) + len(text)
+
+    with _open_write(fname + "c", "wb") as file:
+        file.write(_compiled_header.pack(_compiled_magic, len(entries), *signature))
+        file.write(b"".join(records))
+        file.write(b"".join(blob))
+    return fname + "c"
 
 
 def create_lng_file(language_locale: str, extra_dict: dict = {}, **extra: str) -> None:
@@ -69,13 +672,12 @@ def create_lng_file(language_locale: str, extra_dict: dict = {}, **extra: str) -
 
     lng_file = BaseXMLBuilder(language_locale)
 
-    for package, entry_dict in extra_dict.items():
+    entries = {}
+    for package, entry_dict in list(extra_dict.items()) + list(extra.items()):
         for entry_name, entry_text in entry_dict.items():
-            lng_file.create_root_element(language_locale, str(package) + "." + str(entry_name), text=str(entry_text))
-
-    for package, entry_dict in extra.items():
-        for entry_name, entry_text in entry_dict.items():
-            lng_file.create_root_element(language_locale, str(package) + "." + str(entry_name), text=str(entry_text))
+            entries[str(package) + "." + str(entry_name).replace(" ", "_")] = str(entry_text)
+    for entry, text in entries.items():
+        lng_file.create_root_element(entry, text=text)
     lng_file.write(language_locale + ".lng")
 
 
@@ -129,16 +731,11 @@ def exist_entry(fname: str, package: str, entry: str) -> bool:
 
     :since: 0.1.0
     """
-    from ._utils import BaseXMLReader
+    from ._utils import BaseXMLStreamReader
 
     entry = entry.replace(" ", "_")
 
-    lng_reader = BaseXMLReader(fname)
-    for item in lng_reader.get_infos(["<root>"]).items().index(0):
-        if package + "." + entry in item["childs"]:
-            return True
-        else:
-            return False
+    return BaseXMLStreamReader(fname).exist_child("<root>", package + "." + entry)
 
 
 def start(skill: str, entry: str, format: dict = {}) -> str:
@@ -164,8 +761,15 @@ def start(skill: str, entry: str, format: dict = {}) -> str:
 
     :since: 0.1.0
     """
+    catalog = resolve_catalog(skill, entry)
+    if catalog is not None:
+        return catalog.get(skill, entry, format)
+
     if is_aion:
         from ._utils import import_aion_internal_file as _import_aion_internal_file
         return _import_aion_internal_file("language").start(skill=skill, entry=entry, format=format)
     else:
         no_aion()
+
+
+_add_language_change_callback(_language_changed)
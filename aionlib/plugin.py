@@ -1,10 +1,12 @@
 #!/usr/bin/python3
 
 from . import aion_data_path as _aion_data_path
+from threading import Lock as _Lock
+from types import MappingProxyType as _MappingProxyType
 
 
 RUN_AFTER = "run_after"
-RUN_BEFORE = "run_after"
+RUN_BEFORE = "run_before"
 
 
 run_after_path = _aion_data_path + "/plugins/run_after"
@@ -13,6 +15,11 @@ run_before_path = _aion_data_path + "/plugins/run_before"
 run_after_file = _aion_data_path + "/plugins/run_after/run_after.xml"
 run_before_file = _aion_data_path + "/plugins/run_before/run_before.xml"
 
+_plugin_classes = {}
+_plugin_cache_stats = {"hits": 0, "misses": 0}
+_plugin_lock = _Lock()
+_no_plugins = _MappingProxyType({})
+
 
 class RunAfter:
     """
@@ -88,6 +95,407 @@ class RunBefore:
         pass
 
 
+class AsyncRunAfter(RunAfter):
+    """
+    base class to create custom 'run_after' plugins whose 'main' is a coroutine (see 'skill.run_skill')
+
+    :since: 0.2.0
+    """
+
+    async def main(self) -> None:
+        """
+        gets called (and awaited) if the plugin is run by 'skill.run_skill'
+
+        :return: None
+
+        :since: 0.2.0
+        """
+        pass
+
+
+class AsyncRunBefore(RunBefore):
+    """
+    base class to create custom 'run_before' plugins whose 'main' is a coroutine (see 'skill.run_skill')
+
+    :since: 0.2.0
+    """
+
+    async def main(self) -> None:
+        """
+        gets called (and awaited) if the plugin is run by 'skill.run_skill'
+
+        :return: None
+
+        :since: 0.2.0
+        """
+        pass
+
+
+class PreparedPlugin:
+    """
+    a plugin of a skill, ready to be called. the plugin class is imported at the first call (see '_get_befater_plugin_class').
+    every plugin call of aionlib goes through this class.
+    the infos of the plugin can also be read like the info dicts of 0.1.0 (e.g. 'plugin["method"]', 'plugin.get("after")')
+
+    :since: 0.2.0
+    """
+
+    __slots__ = ("type", "name", "infos")
+
+    def __init__(self, type: (RUN_AFTER, RUN_BEFORE), name: str, infos: dict) -> None:
+        """
+        :param type: (RUN_AFTER, RUN_BEFORE)
+            type of the plugin
+            syntax: <plugin type>
+            example: RUN_AFTER
+        :param name: str
+            name of the plugin
+            syntax: <plugin name>
+            example: "test_plugin"
+        :param infos: dict
+            infos of the plugin
+            syntax: {"method": <plugin class>, "root_plugin": <root plugin name>, <info name>: <info>}
+            example: {"method": "TestPlugin", "root_plugin": "test_plugin"}
+        :return: None
+
+        :since: 0.2.0
+        """
+        self.type = type
+        self.name = name
+        self.infos = infos
+
+    def __call__(self, activate_phrase: str, speech_input: str):
+        """
+        calls the plugin
+
+        :param activate_phrase: str
+            activate phrase, which calls the skill class to which the plugin belongs
+            syntax: <activate phrase>
+            example: "Start test plugin"
+        :param speech_input: str
+            speech input, which calls the skill class to which the plugin belongs
+            syntax: <speech input>
+            example: "Start test plugin"
+        :return: any
+            returns the return value of the 'main' method of the plugin
+            NOTE: if 'main' is a coroutine (see 'AsyncRunAfter', 'AsyncRunBefore'), it's run in a new event loop and its result is returned
+
+        :since: 0.2.0
+        """
+        from inspect import isawaitable
+
+        result = _get_befater_plugin_class(self.type, self.name, self.infos["method"])(activate_phrase, speech_input).main()
+        if isawaitable(result):
+            from asyncio import new_event_loop
+
+            loop = new_event_loop()
+            try:
+                result = loop.run_until_complete(result)
+            finally:
+                loop.close()
+        return result
+
+    def __contains__(self, info_name) -> bool:
+        return info_name in self.infos
+
+    def __getitem__(self, info_name: str):
+        return self.infos[info_name]
+
+    def __iter__(self):
+        return iter(self.infos)
+
+    def __len__(self) -> int:
+        return len(self.infos)
+
+    def get(self, info_name: str, default=None):
+        """
+        returns an info of the plugin
+
+        :param info_name: str
+            name of the info
+            syntax: <info name>
+            example: "method"
+        :param default: any, optional
+            value which is returned if the plugin hasn't the info
+        :return: any
+            returns the info or 'default'
+
+        :since: 0.2.0
+        """
+        return self.infos.get(info_name, default)
+
+    def items(self):
+        return self.infos.items()
+
+    def keys(self):
+        return self.infos.keys()
+
+    def values(self):
+        return self.infos.values()
+
+    def __repr__(self) -> str:
+        return "PreparedPlugin(" + repr(self.type) + ", " + repr(self.name) + ", " + repr(self.infos) + ")"
+
+
+class PluginRouter:
+    """
+    routing table from skill names to their plugins and index of the plugin infos, build from the 'run_after' and 'run_before' plugin files.
+    the tables are shared read only and are only rebuild if one of the plugin files has changed.
+
+    staleness: the plugin files are checked at most every 'check_interval' seconds, so a change of a file (also one made with
+    the xml writers of aionlib) is visible at the latest 'check_interval' seconds later. call 'refresh' to see it at the next lookup.
+    'get_run_after_plugin_infos' and 'get_run_before_plugin_infos' always check the files.
+    returned infos are copies, changing them doesn't change the tables
+
+    :since: 0.2.0
+    """
+
+    def __init__(self, run_after_fname: str = None, run_before_fname: str = None, check_interval: float = 1.0) -> None:
+        """
+        :param run_after_fname: str, optional
+            file of the 'run_after' plugins
+            syntax: <filename>
+            example: "/etc/aion_data/plugins/run_after/run_after.xml"
+            NOTE: if not given, 'run_after_file' is used
+        :param run_before_fname: str, optional
+            file of the 'run_before' plugins
+            syntax: <filename>
+            example: "/etc/aion_data/plugins/run_before/run_before.xml"
+            NOTE: if not given, 'run_before_file' is used
+        :param check_interval: float, optional
+            minimal seconds between two checks if the plugin files have changed
+            syntax: <seconds>
+            example: 1.0
+            NOTE: if it's 0, the files are checked on every lookup
+        :return: None
+
+        :since: 0.2.0
+        """
+        self.run_after_fname = run_after_fname
+        self.run_before_fname = run_before_fname
+        self.check_interval = check_interval
+
+        self._checked = None
+        self._documents = None
+        self._tables = None
+        self._lock = _Lock()
+
+    def _fnames(self) -> tuple:
+        return (self.run_after_fname or run_after_file, self.run_before_fname or run_before_file)
+
+    def _get_tables(self) -> tuple:
+        """
+        returns the routing tables, which are rebuild if a plugin file has changed
+
+        :return: tuple
+            returns the 'run_after' and 'run_before' tables
+            syntax: ((<routes>, <infos>, <plugins by author>, <plugins by package>, <plugins by name>), (<routes>, <infos>, <plugins by author>, <plugins by package>, <plugins by name>))
+            example: (({"TestSkill": (<PreparedPlugin>,)}, {"test_plugin": {"method": "TestPlugin", ...}}, {"blueShard": ("test_plugin",)}, {"aionlib": ("test_plugin",)}, {"TestSkill": {"test_plugin": <PreparedPlugin>}}), ...)
+
+        :since: 0.2.0
+        """
+        from time import monotonic
+        from ._utils import document_cache
+
+        now = monotonic()
+        if self._tables is not None and self._checked is not None and now - self._checked < self.check_interval:
+            return self._tables
+        self._checked = now
+
+        documents = []
+        for fname in self._fnames():
+            try:
+                documents.append(document_cache.get(fname))
+            except FileNotFoundError:
+                documents.append(None)
+
+        tables = self._tables
+        if tables is None or any(document is not old_document for document, old_document in zip(documents, self._documents)):
+            with self._lock:
+                tables = tuple(_build_plugin_table(type, {} if document is None else _read_plugins_document(document))
+                               for type, document in zip((RUN_AFTER, RUN_BEFORE), documents))
+                self._documents = documents
+                self._tables = tables
+        return tables
+
+    def get(self, skill_name: str, type: (RUN_AFTER, RUN_BEFORE) = RUN_AFTER) -> tuple:
+        """
+        returns the plugins of a skill
+
+        :param skill_name: str
+            name of the skill (class)
+            syntax: <skill name>
+            example: "TestSkill"
+        :param type: (RUN_AFTER, RUN_BEFORE), optional
+            type of the plugins
+            syntax: <plugin type>
+            example: RUN_AFTER
+        :return: tuple
+            returns the plugins of the skill in the order they are in the plugin file
+            syntax: (<PreparedPlugin>)
+            example: (PreparedPlugin("run_after", "test_plugin", {"method": "TestPlugin", "root_plugin": "test_plugin"}),)
+
+        :since: 0.2.0
+        """
+        if type not in (RUN_AFTER, RUN_BEFORE):
+            raise ValueError("argument 'type' must be " + RUN_AFTER + " or " + RUN_BEFORE + ", got " + str(type))
+        return self._get_tables()[0 if type == RUN_AFTER else 1][0].get(skill_name, ())
+
+    def infos(self, plugin_name: str, type: (RUN_AFTER, RUN_BEFORE) = RUN_AFTER) -> dict:
+        """
+        returns the infos of a plugin
+
+        :param plugin_name: str
+            name of the plugin
+            syntax: <plugin name>
+            example: "test_plugin"
+        :param type: (RUN_AFTER, RUN_BEFORE), optional
+            type of the plugin
+            syntax: <plugin type>
+            example: RUN_AFTER
+        :return: dict
+            returns the infos of the plugin or None if the plugin doesn't exist
+            syntax: {"method": <plugin class>, "root_plugin": <root plugin name>, "skill": <skill name>, <info name>: <info>}
+            example: {"method": "TestPlugin", "root_plugin": "test_plugin", "skill": "TestSkill", "author": "blueShard"}
+
+        :since: 0.2.0
+        """
+        infos = self._get_tables()[0 if type == RUN_AFTER else 1][1].get(plugin_name)
+        return None if infos is None else dict(infos)
+
+    def plugins(self, skill_name: str, type: (RUN_AFTER, RUN_BEFORE) = RUN_AFTER):
+        """
+        returns the plugins of a skill by their name
+
+        :param skill_name: str
+            name of the skill (class)
+            syntax: <skill name>
+            example: "TestSkill"
+        :param type: (RUN_AFTER, RUN_BEFORE), optional
+            type of the plugins
+            syntax: <plugin type>
+            example: RUN_AFTER
+        :return: types.MappingProxyType
+            returns a read only mapping of the plugins, which is shared by all callers
+            syntax: {<plugin name>: <PreparedPlugin>}
+            example: {"test_plugin": PreparedPlugin("run_after", "test_plugin", {"method": "TestPlugin", "root_plugin": "test_plugin"})}
+
+        :since: 0.2.0
+        """
+        if type not in (RUN_AFTER, RUN_BEFORE):
+            raise ValueError("argument 'type' must be " + RUN_AFTER + " or " + RUN_BEFORE + ", got " + str(type))
+        return self._get_tables()[0 if type == RUN_AFTER else 1][4].get(skill_name, _no_plugins)
+
+    def plugins_by_author(self, author: str, type: (RUN_AFTER, RUN_BEFORE) = RUN_AFTER) -> list:
+        """
+        returns the names of all plugins of an author
+
+        :param author: str
+            name of the author
+            syntax: <author>
+            example: "blueShard"
+        :param type: (RUN_AFTER, RUN_BEFORE), optional
+            type of the plugins
+            syntax: <plugin type>
+            example: RUN_AFTER
+        :return: list
+            returns the plugin names
+            syntax: [<plugin name>]
+            example: ["test_plugin"]
+
+        :since: 0.2.0
+        """
+        return list(self._get_tables()[0 if type == RUN_AFTER else 1][2].get(author, ()))
+
+    def plugins_by_package(self, package: str, type: (RUN_AFTER, RUN_BEFORE) = RUN_AFTER) -> list:
+        """
+        returns the names of all plugins which require a python3 package
+
+        :param package: str
+            name of the python3 package
+            syntax: <python3 package>
+            example: "aionlib"
+        :param type: (RUN_AFTER, RUN_BEFORE), optional
+            type of the plugins
+            syntax: <plugin type>
+            example: RUN_AFTER
+        :return: list
+            returns the plugin names
+            syntax: [<plugin name>]
+            example: ["test_plugin"]
+
+        :since: 0.2.0
+        """
+        return list(self._get_tables()[0 if type == RUN_AFTER else 1][3].get(package, ()))
+
+    def plugins_by_skill(self, skill_name: str, type: (RUN_AFTER, RUN_BEFORE) = RUN_AFTER) -> list:
+        """
+        returns the names of all plugins of a skill
+
+        :param skill_name: str
+            name of the skill (class)
+            syntax: <skill name>
+            example: "TestSkill"
+        :param type: (RUN_AFTER, RUN_BEFORE), optional
+            type of the plugins
+            syntax: <plugin type>
+            example: RUN_AFTER
+        :return: list
+            returns the plugin names
+            syntax: [<plugin name>]
+            example: ["test_plugin"]
+
+        :since: 0.2.0
+        """
+        return [plugin.name for plugin in self.get(skill_name, type)]
+
+    def refresh(self) -> None:
+        """
+        checks the plugin files for changes at the next lookup, even if 'check_interval' hasn't elapsed
+
+        :return: None
+
+        :since: 0.2.0
+        """
+        self._checked = None
+
+    def skills(self, type: (RUN_AFTER, RUN_BEFORE) = RUN_AFTER) -> list:
+        """
+        returns the names of all skills which have plugins
+
+        :param type: (RUN_AFTER, RUN_BEFORE), optional
+            type of the plugins
+            syntax: <plugin type>
+            example: RUN_AFTER
+        :return: list
+            returns the skill names
+            syntax: [<skill name>]
+            example: ["TestSkill"]
+
+        :since: 0.2.0
+        """
+        return list(self._get_tables()[0 if type == RUN_AFTER else 1][0])
+
+
+plugin_router = PluginRouter()
+
+
+def clear_plugin_cache() -> None:
+    """
+    clears the cache of imported plugin classes, so that the next call of a plugin imports it again (e.g. after a plugin was updated)
+
+    :return: None
+
+    :since: 0.2.0
+    """
+    from sys import modules
+
+    with _plugin_lock:
+        for type, fname, _ in _plugin_classes:
+            modules.pop(_plugin_module_name(type, fname), None)
+        _plugin_classes.clear()
+
+
 def create_run_after_plugin_file(author: str,
                                  plugin_name: str,
                                  main_file: str,
@@ -99,7 +507,9 @@ def create_run_after_plugin_file(author: str,
                                  language_locales: list = [],
                                  language_dict: dict = {},
                                  license: str = "",
-                                 required_python3_packages: list = []) -> None:
+                                 required_python3_packages: list = [],
+                                 after: list = [],
+                                 timeout: float = None) -> None:
     """
     creates a file from which a 'run_after' plugin can be installed
 
@@ -159,6 +569,14 @@ def create_run_after_plugin_file(author: str,
         list of python3 packages your plugin needs for correct execution
         syntax: [<python3 package>]
         example: ["aionlib"]
+    :param after: list, optional
+        names of the plugins of the same skill which must be finished before your plugin starts (see 'skill.Skill.start_plugins')
+        syntax: [<plugin name>]
+        example: ["test_plugin_log"]
+    :param timeout: float, optional
+        seconds after which your plugin counts as failed if it's run by 'skill.Skill.start_plugins'
+        syntax: <seconds>
+        example: 2.5
     :return: None
 
     :since: 0.1.0
@@ -175,7 +593,9 @@ def create_run_after_plugin_file(author: str,
                                 language_locales,
                                 language_dict,
                                 license,
-                                required_python3_packages)
+                                required_python3_packages,
+                                after,
+                                timeout)
 
 
 def create_run_before_plugin_file(author: str,
@@ -189,7 +609,9 @@ def create_run_before_plugin_file(author: str,
                                   language_locales: list = [],
                                   language_dict: dict = {},
                                   license: str = "",
-                                  required_python3_packages: list = []) -> None:
+                                  required_python3_packages: list = [],
+                                  after: list = [],
+                                  timeout: float = None) -> None:
     """
     creates a file from which a 'run_before' plugin can be installed
 
@@ -253,6 +675,14 @@ def create_run_before_plugin_file(author: str,
         list of python3 packages your plugin needs for correct execution
         syntax: [<python3 package>]
         example: ["aionlib"]
+    :param after: list, optional
+        names of the plugins of the same skill which must be finished before your plugin starts (see 'skill.Skill.start_plugins')
+        syntax: [<plugin name>]
+        example: ["test_plugin_log"]
+    :param timeout: float, optional
+        seconds after which your plugin counts as failed if it's run by 'skill.Skill.start_plugins'
+        syntax: <seconds>
+        example: 2.5
     :return: None
 
     :since: 0.1.0
@@ -269,7 +699,9 @@ def create_run_before_plugin_file(author: str,
                                 language_locales,
                                 language_dict,
                                 license,
-                                required_python3_packages)
+                                required_python3_packages,
+                                after,
+                                timeout)
 
 
 def create_plugin_package(dir_name: str) -> None:
@@ -324,32 +756,13 @@ def get_all_run_after_plugins() -> dict:
     :since: 0.1.0
     """
     from . import is_aion
-    from .utils import is_dict_in_dict
-    from ._utils import no_aion, BaseXMLReader
-
-    run_after = {}
+    from ._utils import no_aion
 
     if is_aion:
-        for value in BaseXMLReader(run_after_file).get_infos("<all>").values():
-            for child in value:
-                attrib = child["attrib"]
-                parent_tag = child["parent"]["tag"]
-                parent_attrib = child["parent"]["attrib"]
-                if is_dict_in_dict({"type": "skill"}, parent_attrib):
-                    try:
-                        run_after[parent_tag][child["tag"]] = {"method": attrib["method"], "root_plugin": attrib["root_plugin"]}
-                    except KeyError:
-                        run_after[parent_tag] = {}
-                else:
-                    for skill in run_after.values():
-                        for plugin in skill:
-                            if plugin == parent_tag:
-                                run_after[skill][plugin][child["tag"]] = child["text"]
-                                break
+        return _read_plugins(run_after_file)
     else:
         no_aion()
-
-    return run_after
+        return {}
 
 
 def get_all_run_before_plugins() -> dict:
@@ -362,32 +775,28 @@ def get_all_run_before_plugins() -> dict:
     :since: 0.1.0
     """
     from . import is_aion
-    from .utils import is_dict_in_dict
-    from ._utils import no_aion, BaseXMLReader
-
-    run_before = {}
+    from ._utils import no_aion
 
     if is_aion:
-        for value in BaseXMLReader(run_before_file).get_infos("<all>").values():
-            for child in value:
-                attrib = child["attrib"]
-                parent_tag = child["parent"]["tag"]
-                parent_attrib = child["parent"]["attrib"]
-                if is_dict_in_dict({"type": "skill"}, parent_attrib):
-                    try:
-                        run_before[parent_tag][child["tag"]] = {"method": attrib["method"], "root_plugin": attrib["root_plugin"]}
-                    except KeyError:
-                        run_before[parent_tag] = {}
-                else:
-                    for skill in run_before.values():
-                        for plugin in skill:
-                            if plugin == parent_tag:
-                                run_before[skill][plugin][child["tag"]] = child["text"]
-                                break
+        return _read_plugins(run_before_file)
     else:
         no_aion()
+        return {}
+
+
+def get_plugin_cache_stats() -> dict:
+    """
+    returns statistics of the cache of imported plugin classes
+
+    :return: dict
+        returns the number of cache hits, misses and cached plugin classes
+        syntax: {"hits": <hits>, "misses": <misses>, "size": <cached plugin classes>}
+        example: {"hits": 41, "misses": 2, "size": 2}
 
-    return run_before
+    :since: 0.2.0
+    """
+    with _plugin_lock:
+        return {"hits": _plugin_cache_stats["hits"], "misses": _plugin_cache_stats["misses"], "size": len(_plugin_classes)}
 
 
 def get_run_after_plugin_infos(plugin_name: str) -> dict:
@@ -427,10 +836,13 @@ def get_run_after_plugin_infos(plugin_name: str) -> dict:
 
     :since: 0.1.0
     """
-    for skill in get_all_run_after_plugins().values():
-        for plugin, infos in skill.values():
-            if plugin == plugin_name:
-                return infos
+    from . import is_aion
+    from ._utils import no_aion
+
+    if is_aion:
+        return _get_plugin_infos(plugin_name, RUN_AFTER)
+    else:
+        no_aion()
 
 
 def get_run_before_plugin_infos(plugin_name: str) -> dict:
@@ -470,10 +882,13 @@ def get_run_before_plugin_infos(plugin_name: str) -> dict:
 
     :since: 0.1.0
     """
-    for skill in get_all_run_before_plugins().values():
-        for plugin, infos in skill.values():
-            if plugin == plugin_name:
-                return infos
+    from . import is_aion
+    from ._utils import no_aion
+
+    if is_aion:
+        return _get_plugin_infos(plugin_name, RUN_BEFORE)
+    else:
+        no_aion()
 
 
 def _create_befater_plugin_file(type: (RUN_AFTER, RUN_BEFORE),
@@ -488,7 +903,9 @@ def _create_befater_plugin_file(type: (RUN_AFTER, RUN_BEFORE),
                                 language_locales: list = [],
                                 language_dict: dict = {},
                                 license: str = "",
-                                required_python3_packages: list = []) -> None:
+                                required_python3_packages: list = [],
+                                after: list = [],
+                                timeout: float = None) -> None:
     """
     creates a file from which a plugin can be installed
 
@@ -552,6 +969,14 @@ def _create_befater_plugin_file(type: (RUN_AFTER, RUN_BEFORE),
         list of python3 packages your plugin needs for correct execution
         syntax: [<python3 package>]
         example: ["aionlib"]
+    :param after: list, optional
+        names of the plugins of the same skill which must be finished before your plugin starts (see 'skill.Skill.start_plugins')
+        syntax: [<plugin name>]
+        example: ["test_plugin_log"]
+    :param timeout: float, optional
+        seconds after which your plugin counts as failed if it's run by 'skill.Skill.start_plugins'
+        syntax: <seconds>
+        example: 2.5
     :return: None
 
     :since: 0.1.0
@@ -628,6 +1053,17 @@ def _create_befater_plugin_file(type: (RUN_AFTER, RUN_BEFORE),
         raise TypeError("argument 'required_python3_packages' must be list or tuple, got " + type(required_python3_packages).__name__)
     write_dict["required_python3_packages"] = required_python3_packages
 
+    if isinstance(after, (list, tuple)) is False:
+        raise TypeError("argument 'after' must be list or tuple, got " + after.__class__.__name__)
+    write_dict["after"] = after
+
+    if timeout is not None:
+        if isinstance(timeout, (int, float)) is False:
+            raise TypeError("argument 'timeout' must be int or float, got " + timeout.__class__.__name__)
+        if timeout <= 0:
+            raise ValueError("argument 'timeout' must be greater than 0, got " + str(timeout))
+    write_dict["timeout"] = timeout
+
     # ----- #
 
     with open("plugin.aion", "w") as file:
@@ -637,6 +1073,205 @@ def _create_befater_plugin_file(type: (RUN_AFTER, RUN_BEFORE),
         file.close()
 
 
+def _get_befater_plugin_class(type: (RUN_AFTER, RUN_BEFORE), fname: str, plugin_name: str) -> type:
+    """
+    imports the class of a plugin from '<plugin directory>/<fname>.py' (or the package '<plugin directory>/<fname>') under a name which contains its type (see '_plugin_module_name')
+
+    :param type: (RUN_AFTER, RUN_BEFORE)
+        type of the plugin
+        syntax: <plugin type>
+        example: RUN_AFTER
+    :param fname: str
+        name of the module where the plugin is defined
+        syntax: <module name>
+        example: "test"
+    :param plugin_name: str
+        name of the plugin class
+        syntax: <plugin name>
+        example: "TestPlugin"
+    :return: type
+        returns the plugin class
+
+    :since: 0.2.0
+    """
+    key = (type, fname, plugin_name)
+    try:
+        plugin_class = _plugin_classes[key]
+        _plugin_cache_stats["hits"] += 1
+        return plugin_class
+    except KeyError:
+        pass
+
+    from importlib.util import module_from_spec, spec_from_file_location
+    from os.path import isfile
+    from sys import modules, path
+
+    with _plugin_lock:
+        plugin_path = run_after_path if type == RUN_AFTER else run_before_path
+        # the plugin directory is still needed on the path for the other modules of a plugin (e.g. its 'additional_directories')
+        if plugin_path not in path:
+            path.insert(1, plugin_path)
+
+        module_name = _plugin_module_name(type, fname)
+        module = modules.get(module_name)
+        if module is None:
+            if isfile(plugin_path + "/" + fname + ".py"):
+                spec = spec_from_file_location(module_name, plugin_path + "/" + fname + ".py")
+            else:
+                spec = spec_from_file_location(module_name, plugin_path + "/" + fname + "/__init__.py", submodule_search_locations=[plugin_path + "/" + fname])
+            if spec is None or not isfile(spec.origin):
+                raise ModuleNotFoundError("couldn't find the " + type + " plugin module " + fname + " in " + plugin_path, name=module_name)
+            module = module_from_spec(spec)
+            modules[module_name] = module
+            try:
+                spec.loader.exec_module(module)
+            except BaseException:
+                del modules[module_name]
+                raise
+        plugin_class = _plugin_classes[key] = getattr(module, plugin_name)
+        _plugin_cache_stats["misses"] += 1
+    return plugin_class
+
+
+def _build_plugin_table(type: (RUN_AFTER, RUN_BEFORE), plugins: dict) -> tuple:
+    """
+    builds the routing table and the info indexes of all plugins of a type
+
+    :param type: (RUN_AFTER, RUN_BEFORE)
+        type of the plugins
+        syntax: <plugin type>
+        example: RUN_AFTER
+    :param plugins: dict
+        the plugins of every skill (see '_read_plugins_document')
+    :return: tuple
+        returns the tables
+        syntax: ({<skill name>: (<PreparedPlugin>)}, {<plugin name>: <infos>}, {<author>: (<plugin name>)}, {<python3 package>: (<plugin name>)}, {<skill name>: {<plugin name>: <PreparedPlugin>}})
+
+    :since: 0.2.0
+    """
+    from ast import literal_eval
+
+    routes = {}
+    by_name = {}
+    names = {}
+    authors = {}
+    packages = {}
+    for skill, skill_plugins in plugins.items():
+        routes[skill] = tuple(PreparedPlugin(type, name, infos) for name, infos in skill_plugins.items())
+        by_name[skill] = _MappingProxyType({plugin.name: plugin for plugin in routes[skill]})
+        for name, infos in skill_plugins.items():
+            if name in names:
+                # the first plugin with a name wins, like the linear search did before
+                continue
+            names[name] = dict(infos, skill=skill)
+            if infos.get("author"):
+                authors.setdefault(infos["author"], []).append(name)
+            try:
+                required_packages = literal_eval(infos.get("required_python3_packages") or "[]")
+            except (SyntaxError, ValueError):
+                required_packages = [infos["required_python3_packages"]]
+            if isinstance(required_packages, str):
+                required_packages = [required_packages]
+            for package in required_packages:
+                packages.setdefault(str(package), []).append(name)
+
+    return routes, names, {author: tuple(names) for author, names in authors.items()}, {package: tuple(names) for package, names in packages.items()}, by_name
+
+
+def _get_plugin_infos(plugin_name: str, type: (RUN_AFTER, RUN_BEFORE)) -> dict:
+    """
+    returns the infos of a plugin like they were returned before the infos were indexed by 'plugin_router'.
+    unlike 'PluginRouter.infos' the plugin files are always checked for changes and the infos don't contain the skill name
+
+    :param plugin_name: str
+        name of the plugin
+        syntax: <plugin name>
+        example: "test_plugin"
+    :param type: (RUN_AFTER, RUN_BEFORE)
+        type of the plugin
+        syntax: <plugin type>
+        example: RUN_AFTER
+    :return: dict
+        returns the infos of the plugin or None if the plugin doesn't exist
+        syntax: {"method": <plugin class>, "root_plugin": <root plugin name>, <info name>: <info>}
+        example: {"method": "TestPlugin", "root_plugin": "test_plugin", "author": "blueShard"}
+
+    :since: 0.2.0
+    """
+    # the files are only stat-ed by the document cache, they are parsed again only if they have changed
+    plugin_router.refresh()
+    infos = plugin_router.infos(plugin_name, type)
+    if infos is not None:
+        del infos["skill"]
+    return infos
+
+
+def _plugin_module_name(type: (RUN_AFTER, RUN_BEFORE), fname: str) -> str:
+    """
+    returns the name under which the module of a plugin is imported, it contains the plugin type,
+    so that modules with the same name in the 'run_after' and 'run_before' directory don't replace each other
+
+    :param type: (RUN_AFTER, RUN_BEFORE)
+        type of the plugin
+        syntax: <plugin type>
+        example: RUN_AFTER
+    :param fname: str
+        name of the module where the plugin is defined
+        syntax: <module name>
+        example: "test"
+    :return: str
+        returns the module name
+        syntax: aion_plugins.<plugin type>.<module name>
+        example: "aion_plugins.run_after.test"
+
+    :since: 0.2.0
+    """
+    return "aion_plugins." + type + "." + fname
+
+
+def _read_plugins(fname: str) -> dict:
+    """
+    reads all plugins of a plugin file
+
+    :param fname: str
+        file of the plugins
+        syntax: <filename>
+        example: "/etc/aion_data/plugins/run_after/run_after.xml"
+    :return: dict
+        returns the plugins of every skill (see '_read_plugins_document')
+
+    :since: 0.2.0
+    """
+    from ._utils import document_cache
+
+    return _read_plugins_document(document_cache.get(fname))
+
+
+def _read_plugins_document(document) -> dict:
+    """
+    reads all plugins of a plugin file in one pass
+
+    :param document: XMLDocument
+        document of the plugin file
+    :return: dict
+        returns the plugins of every skill
+        syntax: {<skill name>: {<plugin name>: {"method": <plugin class>, "root_plugin": <root plugin name>, <info name>: <info>}}}
+        example: {"TestSkill": {"test_plugin": {"method": "TestPlugin", "root_plugin": "test_plugin", "version": "1.0.0"}}}
+
+    :since: 0.2.0
+    """
+    plugins = {}
+    for skill in document.root:
+        if skill.get("type") != "skill":
+            continue
+        skill_plugins = plugins.setdefault(skill.tag, {})
+        for plugin in skill:
+            infos = skill_plugins[plugin.tag] = {"method": plugin.get("method"), "root_plugin": plugin.get("root_plugin")}
+            for info in plugin:
+                infos[info.tag] = info.text
+    return plugins
+
+
 def _run_befater_plugin(type: str, fname: str, plugin_name: str, activate_phrase: str, speech_input: str) -> None:
     """
     runs a plugin
@@ -665,6 +1300,4 @@ def _run_befater_plugin(type: str, fname: str, plugin_name: str, activate_phrase
 
     :since: 0.1.0
     """
-    from sys import path
-    path.insert(1, _aion_data_path + "/" + type.lower())
-    exec("__import__('" + fname + "')." + plugin_name + "(" + activate_phrase + ", " + speech_input + ").main()")
\ No newline at end of file
+    PreparedPlugin(type, fname, {"method": plugin_name})(activate_phrase, speech_input)
\ No newline at end of file
@@ -1,11 +1,26 @@
 #!/usr/bin/python3
 
 from . import aion_data_path as _aion_data_path
+from ._errors import PluginError
+from .plugin import plugin_router as _plugin_router, RUN_AFTER as _RUN_AFTER, RUN_BEFORE as _RUN_BEFORE
+from threading import Lock as _Lock
 
 
 skills_path = _aion_data_path + "/skills"
 skills_file = skills_path + "/skills.xml"
 
+#: maximal number of plugins which are run at the same time by 'Skill.start_plugins'
+plugin_workers = 8
+#: seconds after which a plugin run by 'Skill.start_plugins' counts as failed, if neither the plugin nor the call defines a timeout. None waits forever
+plugin_timeout = 30.0
+
+_abandoned_plugins = set()
+_set_up_skills = set()
+_set_up_skills_locks = {}
+_set_up_skills_lock = _Lock()
+_plugin_executor = None
+_plugin_executor_lock = _Lock()
+
 
 class Skill:
     """
@@ -14,7 +29,11 @@ class Skill:
     :since: 0.1.0
     """
 
-    def __init__(self, activate_phrase: str, speech_input: str, run_after_plugins: dict, run_before_plugins: dict) -> None:
+    #: set it to True in a subclass if the instances of the skill can be reused for multiple commands (see 'SkillPool').
+    #: poolable skills should load their heavy state (models, connections, ...) in 'setup' and rebind everything that belongs to a command in 'reset'
+    poolable = False
+
+    def __init__(self, activate_phrase: str, speech_input: str, run_after_plugins: dict = None, run_before_plugins: dict = None) -> None:
         """
         :param activate_phrase: str
             activate phrase that called this class
@@ -24,26 +43,67 @@ class Skill:
             complete spoken words
             syntax: "<speech input>"
             example: "Start the test"
-        :param run_after_plugins: dict
+        :param run_after_plugins: dict, optional
             all run after plugins
-        :param run_before_plugins: dict
+            syntax: {<skill name>: {<plugin name>: {"method": <plugin class>, <info name>: <info>}}}
+            example: {"TestSkill": {"test_plugin": {"method": "TestPlugin", "root_plugin": "test_plugin"}}}
+            NOTE: deprecated, if not given the plugins of the skill are taken from 'plugin.plugin_router'
+        :param run_before_plugins: dict, optional
             all run before plugins
+            syntax: {<skill name>: {<plugin name>: {"method": <plugin class>, <info name>: <info>}}}
+            example: {"TestSkill": {"test_plugin": {"method": "TestPlugin", "root_plugin": "test_plugin"}}}
+            NOTE: deprecated, if not given the plugins of the skill are taken from 'plugin.plugin_router'
         :return: None
 
         :since: 0.1.0
         """
+        Skill.reset(self, activate_phrase, speech_input)
+
+        if run_after_plugins is not None or run_before_plugins is not None:
+            from warnings import warn
+
+            warn("passing 'run_after_plugins' and 'run_before_plugins' to a skill is deprecated, the plugins are taken from 'plugin.plugin_router'",
+                 DeprecationWarning, stacklevel=2)
+            if run_after_plugins is not None:
+                self.run_after_plugins = _prepare_plugins(_RUN_AFTER, run_after_plugins.get(self.__class__.__name__, {}))
+            if run_before_plugins is not None:
+                self.run_before_plugins = _prepare_plugins(_RUN_BEFORE, run_before_plugins.get(self.__class__.__name__, {}))
+
+    @classmethod
+    def setup(cls) -> None:
+        """
+        gets called once per process for a poolable skill class (see 'poolable'), before a 'SkillPool' creates its first instance.
+        load heavy state (models, connections, ...) here and store it on the class, so that it's loaded only once and shared by all instances
+
+        :return: None
+
+        :since: 0.2.0
+        """
+        pass
+
+    def reset(self, activate_phrase: str, speech_input: str) -> None:
+        """
+        binds the data of a new command to the instance, gets called before a pooled instance is reused.
+        the plugins of the skill ('run_after_plugins', 'run_before_plugins') are the shared read only mappings of 'plugin.plugin_router' (see 'plugin.PluginRouter.plugins')
+
+        :param activate_phrase: str
+            activate phrase that called this class
+            syntax: "<activate phrase>"
+            example: "test"
+        :param speech_input: str
+            complete spoken words
+            syntax: "<speech input>"
+            example: "Start the test"
+        :return: None
+
+        :since: 0.2.0
+        """
         self.activate_phrase = activate_phrase
         self.activate_phrase_list = activate_phrase.split("__and__")
         self.speech_input = speech_input
 
-        try:
-            self.run_after_plugins = run_after_plugins[self.__class__.__name__]
-        except KeyError:
-            self.run_after_plugins = {}
-        try:
-            self.run_before_plugins = run_before_plugins[self.__class__.__name__]
-        except KeyError:
-            self.run_before_plugins = {}
+        self.run_after_plugins = _plugin_router.plugins(self.__class__.__name__, _RUN_AFTER)
+        self.run_before_plugins = _plugin_router.plugins(self.__class__.__name__, _RUN_BEFORE)
 
     def main(self) -> None:
         """
@@ -87,13 +147,8 @@ class Skill:
 
         :since: 0.1.0
         """
-        try:
-            from .plugin import _run_befater_plugin, RUN_AFTER
-        except ImportError:
-            from plugin import _run_befater_plugin, RUN_AFTER
-
         if plugin_name in self.run_after_plugins:
-            _run_befater_plugin(RUN_AFTER, plugin_name, self.run_after_plugins[plugin_name]["method"], self.activate_phrase, self.speech_input)
+            self.run_after_plugins[plugin_name](self.activate_phrase, self.speech_input)
 
     def start_run_before_plugin(self, plugin_name: str) -> None:
         """
@@ -107,13 +162,106 @@ class Skill:
 
         :since: 0.1.0
         """
-        try:
-            from .plugin import _run_befater_plugin, RUN_BEFORE
-        except ImportError:
-            from plugin import _run_befater_plugin, RUN_BEFORE
-
         if plugin_name in self.run_before_plugins:
-            _run_befater_plugin(RUN_BEFORE, plugin_name, self.run_before_plugins[plugin_name]["method"], self.activate_phrase, self.speech_input)
+            self.run_before_plugins[plugin_name](self.activate_phrase, self.speech_input)
+
+    def start_plugins(self, plugin_names: list = None, type: str = "run_after", parallel: bool = True, timeout: float = None) -> dict:
+        """
+        calls multiple 'run_after' or 'run_before' plugins, by default in parallel in a shared thread pool (see 'plugin_workers').
+        the infos of a plugin (see 'plugin.PreparedPlugin.infos') can contain
+        'timeout' (seconds after which the plugin counts as failed) and 'after' (names of plugins which must be finished before the plugin starts, separated by commas)
+
+        :param plugin_names: list, optional
+            names of the plugins that should be called
+            syntax: [<plugin name>]
+            example: ["ExampleClass"]
+            NOTE: if not given, all plugins of the type are called
+        :param type: (plugin.RUN_AFTER, plugin.RUN_BEFORE), optional
+            type of the plugins
+            syntax: <plugin type>
+            example: plugin.RUN_AFTER
+        :param parallel: bool, optional
+            sets if independent plugins should run at the same time
+            syntax: <boolean>
+            example: True
+        :param timeout: float, optional
+            seconds after which a plugin counts as failed, if the plugin doesn't define its own timeout.
+            the time a plugin waits for a free worker counts too
+            syntax: <seconds>
+            example: 2.5
+            NOTE: if not given, 'plugin_timeout' is used
+            NOTE2: a timed out plugin can't be stopped, it only isn't waited for anymore. if all workers are blocked by timed out plugins, a new thread pool is used
+        :return: dict
+            returns the return values of all successful plugins and the errors of all failed plugins
+            syntax: {"results": {<plugin name>: <return value>}, "errors": {<plugin name>: <exception>}}
+            example: {"results": {"ExampleClass": None}, "errors": {"OtherClass": TimeoutError("...")}}
+
+        :since: 0.2.0
+        """
+        from concurrent.futures import wait, FIRST_COMPLETED
+        from time import monotonic
+        from .plugin import RUN_AFTER, RUN_BEFORE
+
+        if type not in (RUN_AFTER, RUN_BEFORE):
+            raise ValueError("argument 'type' must be " + RUN_AFTER + " or " + RUN_BEFORE + ", got " + str(type))
+        plugins = self.run_after_plugins if type == RUN_AFTER else self.run_before_plugins
+        if plugin_names is None:
+            plugin_names = list(plugins)
+
+        results = {}
+        errors = {}
+        pending = {}
+        for plugin_name in plugin_names:
+            if plugin_name not in plugins:
+                errors[plugin_name] = KeyError("the plugin " + plugin_name + " doesn't exist")
+                continue
+            after = _plugin_after(plugins[plugin_name].infos)
+            # constraints on plugins which aren't called are ignored
+            pending[plugin_name] = set(name for name in after if name in plugin_names and name in plugins and name != plugin_name)
+        _check_plugin_order(pending)
+
+        if timeout is None:
+            timeout = plugin_timeout
+
+        executor = _get_plugin_executor()
+        limit = plugin_workers if parallel else 1
+        running = {}
+        while pending or running:
+            for plugin_name in list(pending):
+                failed = [name for name in pending[plugin_name] if name in errors]
+                if failed:
+                    del pending[plugin_name]
+                    errors[plugin_name] = RuntimeError("the plugin " + plugin_name + " wasn't called, because the plugin " + failed[0] + " failed")
+                elif len(running) < limit and not pending[plugin_name] - results.keys():
+                    del pending[plugin_name]
+                    own_timeout = _plugin_timeout(plugins[plugin_name].infos)
+                    if own_timeout is None:
+                        own_timeout = timeout
+                    deadline = None if own_timeout is None else monotonic() + own_timeout
+                    future = executor.submit(plugins[plugin_name], self.activate_phrase, self.speech_input)
+                    running[future] = (plugin_name, deadline)
+            if not running:
+                # only plugins whose dependencies failed were left
+                continue
+
+            deadlines = [deadline for _, deadline in running.values() if deadline is not None]
+            done, _ = wait(running, None if not deadlines else max(min(deadlines) - monotonic(), 0), FIRST_COMPLETED)
+            for future in done:
+                plugin_name, _ = running.pop(future)
+                try:
+                    results[plugin_name] = future.result()
+                except Exception as error:
+                    errors[plugin_name] = error
+            now = monotonic()
+            for future, (plugin_name, deadline) in list(running.items()):
+                if deadline is not None and deadline <= now:
+                    del running[future]
+                    errors[plugin_name] = TimeoutError("the plugin " + plugin_name + " didn't finish in time")
+                    # a plugin which is still queued is never started, a running one keeps its worker until it returns
+                    if not future.cancel():
+                        _abandon_plugin(future)
+
+        return {"results": results, "errors": errors}
 
     def speech_output(self, speech_output: str) -> None:
         """
@@ -135,6 +283,521 @@ class Skill:
         _speech_output(speech_output)
 
 
+class AsyncSkill(Skill):
+    """
+    base class for skills whose 'main', 'run_before' and 'run_after' are coroutines.
+    async skills are run by 'run_skill', so skills which are waiting for I/O don't block the others
+
+    :since: 0.2.0
+    """
+
+    async def main(self) -> None:
+        """
+        gets called (and awaited) if user says the defined activate_phrase
+
+        :return: None
+
+        :since: 0.2.0
+        """
+        pass
+
+    async def run_after(self) -> None:
+        """
+        gets called (and awaited) after the 'main' function was executed
+
+        :return: None
+
+        :since: 0.2.0
+        """
+        pass
+
+    async def run_before(self) -> None:
+        """
+        gets called (and awaited) before the 'main' function was executed
+
+        :return: None
+
+        :since: 0.2.0
+        """
+        pass
+
+
+class SkillPool:
+    """
+    keeps warm instances of poolable skills (see 'Skill.poolable'), so that they are reused instead of created for every command.
+    'Skill.setup' of a poolable skill class runs only once per process, not once per instance or command
+
+    :since: 0.2.0
+    """
+
+    def __init__(self, max_idle: int = 4) -> None:
+        """
+        :param max_idle: int, optional
+            maximal number of idle instances which are kept per skill class
+            syntax: <number>
+            example: 4
+        :return: None
+
+        :since: 0.2.0
+        """
+        self.max_idle = max_idle
+
+        self._idle = {}
+        self._lock = _Lock()
+
+    def acquire(self, skill_class: type, activate_phrase: str, speech_input: str) -> Skill:
+        """
+        returns an instance of the skill class for the given command.
+        if the class is poolable and an idle instance exist, it's reset and reused, otherwise a new instance is created.
+        before the first instance of a poolable class is created, 'Skill.setup' of the class is called
+
+        :param skill_class: type
+            the skill class
+            syntax: <class>
+            example: MySkill
+        :param activate_phrase: str
+            activate phrase that called the skill
+            syntax: "<activate phrase>"
+            example: "test"
+        :param speech_input: str
+            complete spoken words
+            syntax: "<speech input>"
+            example: "Start the test"
+        :return: Skill
+            returns the instance of the skill class
+
+        :since: 0.2.0
+        """
+        if skill_class.poolable:
+            with self._lock:
+                try:
+                    skill = self._idle[skill_class].pop()
+                except (IndexError, KeyError):
+                    skill = None
+            if skill is not None:
+                skill.reset(activate_phrase, speech_input)
+                return skill
+            _setup_skill(skill_class)
+
+        return skill_class(activate_phrase, speech_input)
+
+    def clear(self, skill_class: type = None) -> None:
+        """
+        drops the idle instances
+
+        :param skill_class: type, optional
+            the skill class whose idle instances should be dropped
+            syntax: <class>
+            example: MySkill
+            NOTE: if not given, the idle instances of all skill classes are dropped
+        :return: None
+
+        :since: 0.2.0
+        """
+        with self._lock:
+            if skill_class is None:
+                self._idle.clear()
+            else:
+                self._idle.pop(skill_class, None)
+
+    def release(self, skill: Skill) -> None:
+        """
+        gives an instance, which was returned by 'acquire', back to the pool.
+        instances of not poolable skills are dropped
+
+        :param skill: Skill
+            the skill instance
+        :return: None
+
+        :since: 0.2.0
+        """
+        skill_class = skill.__class__
+        if skill_class.poolable:
+            with self._lock:
+                idle = self._idle.setdefault(skill_class, [])
+                if len(idle) < self.max_idle and skill not in idle:
+                    idle.append(skill)
+
+    def run(self, skill_class: type, method: str, activate_phrase: str, speech_input: str):
+        """
+        calls a method of a (pooled) instance of the skill class and gives the instance back to the pool afterwards
+
+        :param skill_class: type
+            the skill class
+            syntax: <class>
+            example: MySkill
+        :param method: str
+            name of the method that should get called
+            syntax: <method name>
+            example: "main"
+        :param activate_phrase: str
+            activate phrase that called the skill
+            syntax: "<activate phrase>"
+            example: "test"
+        :param speech_input: str
+            complete spoken words
+            syntax: "<speech input>"
+            example: "Start the test"
+        :return: any
+            returns the return value of the method
+            NOTE: coroutine methods (see 'AsyncSkill') are awaited in a new event loop before the instance is given back.
+                  inside a running event loop use 'run_async' instead
+
+        :raises TypeError: if the method is a coroutine function and this is called inside a running event loop
+
+        :since: 0.2.0
+        """
+        from asyncio import new_event_loop
+        from inspect import isawaitable
+
+        skill = self.acquire(skill_class, activate_phrase, speech_input)
+        try:
+            result = getattr(skill, method)()
+            if isawaitable(result):
+                if _in_running_loop():
+                    if hasattr(result, "close"):
+                        result.close()
+                    raise TypeError("'" + method + "' of " + skill_class.__name__ + " must be awaited, use 'SkillPool.run_async' inside a running event loop")
+                loop = new_event_loop()
+                try:
+                    result = loop.run_until_complete(result)
+                finally:
+                    loop.close()
+            return result
+        finally:
+            self.release(skill)
+
+    async def run_async(self, skill_class: type, method: str, activate_phrase: str, speech_input: str, executor=None):
+        """
+        calls a method of a (pooled) instance of the skill class and gives the instance back to the pool after the method has finished.
+        coroutine methods (see 'AsyncSkill') are awaited, all other methods are run in the executor
+
+        :param skill_class: type
+            the skill class
+            syntax: <class>
+            example: MySkill
+        :param method: str
+            name of the method that should get called
+            syntax: <method name>
+            example: "main"
+        :param activate_phrase: str
+            activate phrase that called the skill
+            syntax: "<activate phrase>"
+            example: "test"
+        :param speech_input: str
+            complete spoken words
+            syntax: "<speech input>"
+            example: "Start the test"
+        :param executor: concurrent.futures.Executor, optional
+            executor in which not coroutine methods are called
+            NOTE: if not given, the default executor of the event loop is used
+        :return: any
+            returns the return value of the method
+
+        :since: 0.2.0
+        """
+        skill = self.acquire(skill_class, activate_phrase, speech_input)
+        try:
+            return await _call(getattr(skill, method), executor)
+        finally:
+            self.release(skill)
+
+
+skill_pool = SkillPool()
+
+
+def _prepare_plugins(type: str, plugins: dict):
+    """
+    wraps the plugins of a skill from a 0.1.0 plugin dict (see 'Skill.__init__') like 'plugin.PluginRouter.plugins' does
+
+    :param type: (plugin.RUN_AFTER, plugin.RUN_BEFORE)
+        type of the plugins
+        syntax: <plugin type>
+        example: plugin.RUN_AFTER
+    :param plugins: dict
+        the plugins of the skill
+        syntax: {<plugin name>: {"method": <plugin class>, <info name>: <info>}}
+        example: {"test_plugin": {"method": "TestPlugin", "root_plugin": "test_plugin"}}
+    :return: types.MappingProxyType
+        returns a read only mapping of the plugin names to their 'plugin.PreparedPlugin'
+
+    :since: 0.2.0
+    """
+    from types import MappingProxyType
+    from .plugin import PreparedPlugin
+
+    return MappingProxyType({name: PreparedPlugin(type, name, dict(infos)) for name, infos in plugins.items()})
+
+
+def _in_running_loop() -> bool:
+    """
+    checks if an event loop is running in the current thread
+
+    :return: bool
+        returns True if an event loop is running
+
+    :since: 0.2.0
+    """
+    from asyncio import get_running_loop
+
+    try:
+        get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def _abandon_plugin(future) -> None:
+    """
+    remembers a timed out plugin, which still blocks a worker of the thread pool (see '_get_plugin_executor')
+
+    :param future: concurrent.futures.Future
+        future of the plugin
+    :return: None
+
+    :since: 0.2.0
+    """
+    with _plugin_executor_lock:
+        _abandoned_plugins.add(future)
+    future.add_done_callback(_abandoned_plugins.discard)
+
+
+def _setup_skill(skill_class: type) -> None:
+    """
+    calls 'Skill.setup' of a skill class, if it wasn't called in this process yet.
+    if 'setup' raises an error, it's called again the next time
+
+    :param skill_class: type
+        the skill class
+        syntax: <class>
+        example: MySkill
+    :return: None
+
+    :since: 0.2.0
+    """
+    if skill_class in _set_up_skills:
+        return
+    with _set_up_skills_lock:
+        lock = _set_up_skills_locks.setdefault(skill_class, _Lock())
+    # every class has its own lock, so a slow setup doesn't block the setup of other classes
+    with lock:
+        if skill_class not in _set_up_skills:
+            skill_class.setup()
+            _set_up_skills.add(skill_class)
+
+
+def _check_plugin_order(dependencies: dict) -> None:
+    """
+    checks if the ordering constraints of plugins are free of cycles
+
+    :param dependencies: dict
+        names of the plugins which must be finished before a plugin starts
+        syntax: {<plugin name>: {<plugin name>}}
+        example: {"Notify": {"Log"}, "Log": set()}
+    :return: None
+
+    :since: 0.2.0
+    """
+    remaining = {name: set(after) for name, after in dependencies.items()}
+    while remaining:
+        ready = [name for name, after in remaining.items() if not after]
+        if not ready:
+            raise ValueError("the plugins " + ", ".join(sorted(remaining)) + " are depending on each other")
+        for name in ready:
+            del remaining[name]
+        for after in remaining.values():
+            after.difference_update(ready)
+
+
+def _get_plugin_executor():
+    """
+    returns the thread pool in which 'Skill.start_plugins' runs the plugins, it's created at the first call
+    and replaced if all of its workers are blocked by plugins which have timed out
+
+    :return: concurrent.futures.ThreadPoolExecutor
+        returns the thread pool
+
+    :since: 0.2.0
+    """
+    global _plugin_executor
+
+    if _plugin_executor is None or len(_abandoned_plugins) >= plugin_workers:
+        from concurrent.futures import ThreadPoolExecutor
+        with _plugin_executor_lock:
+            if _plugin_executor is None or len(_abandoned_plugins) >= plugin_workers:
+                if _plugin_executor is not None:
+                    # all workers are blocked by plugins which have timed out, they are left to finish in the old pool
+                    _plugin_executor.shutdown(wait=False)
+                    _abandoned_plugins.clear()
+                _plugin_executor = ThreadPoolExecutor(max_workers=plugin_workers, thread_name_prefix="aionlib-plugin")
+    return _plugin_executor
+
+
+def _plugin_after(infos: dict) -> list:
+    """
+    returns the names of the plugins which must be finished before a plugin starts
+
+    :param infos: dict
+        infos of the plugin (see 'plugin.PreparedPlugin.infos')
+        syntax: {"after": <plugin names>}
+        example: {"after": "['Log']"}
+        NOTE: the plugin names can be a list, the string of a list (like it's stored in the plugin files) or a string of names separated by commas
+    :return: list
+        returns the plugin names
+        syntax: [<plugin name>]
+        example: ["Log"]
+
+    :since: 0.2.0
+    """
+    from ast import literal_eval
+
+    after = infos.get("after") or []
+    if isinstance(after, str):
+        try:
+            after = literal_eval(after)
+        except (SyntaxError, ValueError):
+            pass
+        if isinstance(after, str):
+            after = [name.strip() for name in after.split(",")]
+    return [str(name) for name in after if name]
+
+
+def _plugin_timeout(infos: dict) -> float:
+    """
+    returns the timeout of a plugin
+
+    :param infos: dict
+        infos of the plugin (see 'plugin.PreparedPlugin.infos')
+        syntax: {"timeout": <seconds>}
+        example: {"timeout": "2.5"}
+    :return: float
+        returns the timeout or None if the plugin doesn't define one
+        syntax: <seconds>
+        example: 2.5
+
+    :since: 0.2.0
+    """
+    timeout = infos.get("timeout")
+    if timeout is None or timeout in ("", "None"):
+        return None
+    return float(timeout)
+
+
+async def _call(function, executor=None):
+    """
+    calls a function, coroutine functions are awaited and all other functions are called in the executor
+
+    :param function: function
+        function which should get called
+        syntax: <function>
+        example: skill.main
+    :param executor: concurrent.futures.Executor, optional
+        executor in which not coroutine functions are called
+        NOTE: if not given, the default executor of the event loop is used
+    :return: any
+        returns the return value of the function
+
+    :since: 0.2.0
+    """
+    from asyncio import get_running_loop
+    from inspect import iscoroutinefunction
+
+    if iscoroutinefunction(function):
+        return await function()
+    return await get_running_loop().run_in_executor(executor, function)
+
+
+async def _run_plugins(skill: Skill, type: str) -> None:
+    """
+    runs all plugins of a type of a skill with 'Skill.start_plugins' (same ordering constraints, timeouts and error aggregation),
+    without blocking the event loop
+
+    :param skill: Skill
+        the skill whose plugins should run
+    :param type: (plugin.RUN_AFTER, plugin.RUN_BEFORE)
+        type of the plugins
+        syntax: <plugin type>
+        example: plugin.RUN_AFTER
+    :return: None
+
+    :raises PluginError: if any plugin failed, after all plugins have finished
+
+    :since: 0.2.0
+    """
+    from asyncio import get_running_loop
+    from functools import partial
+    from .plugin import RUN_AFTER
+
+    if not (skill.run_after_plugins if type == RUN_AFTER else skill.run_before_plugins):
+        return
+    # the scheduler blocks while it waits for the plugins, so it runs in the default executor and not in the plugin pool it schedules on
+    report = await get_running_loop().run_in_executor(None, partial(skill.start_plugins, type=type))
+    if report["errors"]:
+        raise PluginError(report["errors"])
+
+
+async def run_skill_async(skill: Skill, plugins: bool = True, executor=None):
+    """
+    runs a skill: its 'run_before' plugins, 'run_before', 'main', 'run_after' and its 'run_after' plugins.
+    the plugins run like in 'Skill.start_plugins': independent plugins at the same time, plugins with an 'after' constraint once the plugins they depend on are finished.
+    coroutine functions of the skill (see 'AsyncSkill') are awaited, all other functions of the skill are run in a thread pool
+
+    :param skill: Skill
+        the skill which should run
+    :param plugins: bool, optional
+        sets if the 'run_after' and 'run_before' plugins of the skill should run
+        syntax: <boolean>
+        example: True
+    :param executor: concurrent.futures.Executor, optional
+        executor in which not async functions of the skill are run
+        NOTE: if not given, the default executor of the event loop is used
+        NOTE2: the plugins are always run in the shared plugin thread pool (see 'plugin_workers')
+    :return: any
+        returns the return value of 'main'
+
+    :raises PluginError: if any 'run_before' plugin failed ('main' isn't called then) or any 'run_after' plugin failed.
+                         all plugins of a type are finished (or timed out) before it's raised
+
+    :since: 0.2.0
+    """
+    from .plugin import RUN_AFTER, RUN_BEFORE
+
+    if plugins:
+        await _run_plugins(skill, RUN_BEFORE)
+    await _call(skill.run_before, executor)
+    result = await _call(skill.main, executor)
+    await _call(skill.run_after, executor)
+    if plugins:
+        await _run_plugins(skill, RUN_AFTER)
+    return result
+
+
+def run_skill(skill: Skill, plugins: bool = True, executor=None):
+    """
+    runs a skill in a new event loop (see 'run_skill_async')
+
+    :param skill: Skill
+        the skill which should run
+    :param plugins: bool, optional
+        sets if the 'run_after' and 'run_before' plugins of the skill should run
+        syntax: <boolean>
+        example: True
+    :param executor: concurrent.futures.Executor, optional
+        executor in which not async functions of the skill are run
+    :return: any
+        returns the return value of 'main'
+
+    :since: 0.2.0
+    """
+    from asyncio import new_event_loop
+
+    loop = new_event_loop()
+    try:
+        return loop.run_until_complete(run_skill_async(skill, plugins, executor))
+    finally:
+        loop.close()
+
+
 def create_skill_file(activate_phrases: dict,
                       author: str,
                       language_locales: list,
@@ -309,7 +972,7 @@ def get_all_skills() -> list:
     from ._utils import no_aion, BaseXMLReader
 
     if is_aion:
-        return BaseXMLReader(skills_file).get_infos("<root>").items().index(0)[0]["childs"]
+        return BaseXMLReader(skills_file).get_infos("<root>").values().index(0)[0]["childs"]
     else:
         no_aion()
         return []
@@ -0,0 +1,87 @@
+#!/usr/bin/python3
+
+"""
+benchmark of the single pass pretty printer ('_utils._write_pretty') against the minidom round trip which was used before.
+serializes a registry like 'skills.xml' with 2500 skills and three info childs each (10001 elements)
+
+usage: python3 benchmarks/bench_pretty_write.py [<number of skills>] [<repeats>]
+"""
+
+from os.path import abspath, dirname
+from sys import argv, path
+from timeit import repeat
+from xml.dom import minidom
+import xml.etree.ElementTree as ET
+
+path.insert(0, dirname(dirname(abspath(__file__))))
+
+from aionlib._utils import _write_pretty
+
+
+def build_registry(skills: int) -> ET.Element:
+    root = ET.Element("skills")
+    for number in range(skills):
+        skill = ET.SubElement(root, "skill_" + str(number), type="skill")
+        ET.SubElement(skill, "author").text = "blueShard"
+        ET.SubElement(skill, "version").text = "1.0." + str(number)
+        ET.SubElement(skill, "description").text = "Skill number " + str(number) + " & <friends>"
+    return root
+
+
+def build_edge_cases() -> list:
+    """
+    returns trees with comments and empty texts, which must be serialized the same by both serializers
+
+    :return: list
+        returns the root elements of the trees
+    """
+    comment_root = ET.Element("skills")
+    comment_root.append(ET.Comment(" installed skills "))
+    skill = ET.SubElement(comment_root, "skill_0", type="skill")
+    skill.append(ET.Comment(""))
+    ET.SubElement(skill, "author").text = None
+    ET.SubElement(skill, "description").text = ""
+
+    text_root = ET.Element("skills")
+    text_root.text = "\n  "
+    ET.SubElement(text_root, "skill_0", type="skill").tail = None
+    return [comment_root, text_root]
+
+
+def minidom_pretty(root: ET.Element) -> str:
+    # the serialization of 'BaseXMLWriter.write' before the single pass printer
+    pre_output = minidom.parseString(ET.tostring(root, "utf-8")).toprettyxml(indent="  ")
+    return "\n".join(pre_output.split("\n")[1:])
+
+
+def single_pass_pretty(root: ET.Element) -> str:
+    parts = []
+    _write_pretty(root, parts.append)
+    return "".join(parts)
+
+
+def main() -> None:
+    skills = int(argv[1]) if len(argv) > 1 else 2500
+    repeats = int(argv[2]) if len(argv) > 2 else 5
+
+    root = build_registry(skills)
+    for tree in [root] + build_edge_cases():
+        if minidom_pretty(tree) != single_pass_pretty(tree):
+            raise AssertionError("the outputs of both serializers are different")
+
+    # a comment without text ('ET.Comment()') is written as an empty comment, ElementTree itself would write the text 'None'
+    empty_comment = ET.Element("skills")
+    empty_comment.append(ET.Comment())
+    if single_pass_pretty(empty_comment) != "<skills>\n  <!---->\n</skills>\n":
+        raise AssertionError("a comment without text isn't written as an empty comment")
+
+    print("elements:", sum(1 for _ in root.iter()))
+    old = min(repeat(lambda: minidom_pretty(root), number=1, repeat=repeats))
+    new = min(repeat(lambda: single_pass_pretty(root), number=1, repeat=repeats))
+    print("minidom round trip: %.1f ms" % (old * 1000))
+    print("single pass:        %.1f ms" % (new * 1000))
+    print("speedup:            %.1fx" % (old / new))
+
+
+if __name__ == "__main__":
+    main()
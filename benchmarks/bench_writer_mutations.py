@@ -0,0 +1,124 @@
+#!/usr/bin/python3
+
+"""
+benchmark of the indexed mutations of 'BaseXMLWriter' against the full tree scans ('root.iter(parent_tag)') which were used before.
+runs 10000 mutations (add, update and remove in rotation) on a registry like 'skills.xml' with 2500 skills and three info childs each
+
+usage: python3 benchmarks/bench_writer_mutations.py [<number of mutations>] [<number of skills>]
+"""
+
+from copy import deepcopy
+from os import remove
+from os.path import abspath, dirname
+from sys import argv, path
+from tempfile import mkstemp
+from time import perf_counter
+import xml.etree.ElementTree as ET
+
+path.insert(0, dirname(dirname(abspath(__file__))))
+
+from aionlib._utils import BaseXMLWriter
+
+
+def build_registry(skills: int) -> ET.Element:
+    root = ET.Element("skills")
+    for number in range(skills):
+        skill = ET.SubElement(root, "skill_" + str(number), type="skill")
+        ET.SubElement(skill, "author").text = "blueShard"
+        ET.SubElement(skill, "version").text = "1.0." + str(number)
+        ET.SubElement(skill, "description").text = "Skill number " + str(number)
+    return root
+
+
+def mutations(count: int, skills: int) -> list:
+    operations = []
+    for number in range(count):
+        step = number // 3
+        skill = "skill_" + str(step % skills)
+        if number % 3 == 0:
+            operations.append(("add", skill, "extra_" + str(step), "extra"))
+        elif number % 3 == 1:
+            operations.append(("update", skill, "version", "2.0." + str(step)))
+        else:
+            operations.append(("remove", skill, "extra_" + str(step), None))
+    return operations
+
+
+# the scans of the 0.1.0 writer (without parent attributes), every mutation walks the whole tree
+def scan_add(root: ET.Element, parent_tag: str, elem_tag: str, text: str) -> None:
+    for parent in root.iter(parent_tag):
+        ET.SubElement(parent, elem_tag).text = text
+
+
+def scan_remove(root: ET.Element, parent_tag: str, elem_tag: str) -> None:
+    for parent in root.iter(parent_tag):
+        for child in list(parent):
+            if child.tag == elem_tag:
+                parent.remove(child)
+
+
+def scan_update(root: ET.Element, parent_tag: str, elem_tag: str, text: str) -> None:
+    for child in root:
+        if child.tag == elem_tag:
+            child.text = text
+    for parent in root.iter(parent_tag):
+        for child in parent:
+            if child.tag == elem_tag:
+                child.text = text
+
+
+def run_scans(root: ET.Element, operations: list) -> None:
+    for action, parent_tag, elem_tag, text in operations:
+        if action == "add":
+            scan_add(root, parent_tag, elem_tag, text)
+        elif action == "update":
+            scan_update(root, parent_tag, elem_tag, text)
+        else:
+            scan_remove(root, parent_tag, elem_tag)
+
+
+def run_writer(writer: BaseXMLWriter, operations: list) -> None:
+    for action, parent_tag, elem_tag, text in operations:
+        if action == "add":
+            writer.add(parent_tag, elem_tag, text=text)
+        elif action == "update":
+            writer.update(parent_tag, elem_tag, text=text)
+        else:
+            writer.remove(parent_tag, elem_tag)
+
+
+def main() -> None:
+    count = int(argv[1]) if len(argv) > 1 else 10000
+    skills = int(argv[2]) if len(argv) > 2 else 2500
+
+    root = build_registry(skills)
+    operations = mutations(count, skills)
+
+    handle, fname = mkstemp(suffix=".xml")
+    try:
+        with open(handle, "w") as file:
+            file.write(ET.tostring(root, "unicode"))
+        writer = BaseXMLWriter(fname)
+
+        scan_root = deepcopy(root)
+        start = perf_counter()
+        run_scans(scan_root, operations)
+        old = perf_counter() - start
+
+        start = perf_counter()
+        run_writer(writer, operations)
+        new = perf_counter() - start
+
+        if ET.tostring(scan_root) != ET.tostring(writer._root):
+            raise AssertionError("the trees of both implementations are different")
+    finally:
+        remove(fname)
+
+    print("mutations:", count, "on", sum(1 for _ in root.iter()), "elements")
+    print("tree scans:     %.3f s" % old)
+    print("indexed writer: %.3f s" % new)
+    print("speedup:        %.1fx" % (old / new))
+
+
+if __name__ == "__main__":
+    main()